@@ -3,18 +3,29 @@ FastAPI implementation for Podcastify podcast generation service.
 
 This module provides REST endpoints for podcast generation and audio serving,
 with configuration management and temporary file handling.
+
+Podcast generation takes minutes, so /generate only enqueues a job and returns its
+ID. Jobs run on a thread pool whose size is set by the PODCASTFY_API_WORKERS
+environment variable, and are polled via /jobs/{job_id} and /jobs/{job_id}/result.
 """
 
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse, JSONResponse
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
 import shutil
+import threading
+import time
+import uuid
 import yaml
 from typing import Dict, Any
 from pathlib import Path
 from ..client import generate_podcast
 import uvicorn
 
+logger = logging.getLogger(__name__)
+
 
 def load_base_config() -> Dict[Any, Any]:
     config_path = Path(__file__).parent / "podcastfy" / "conversation_config.yaml"
@@ -46,79 +57,174 @@ app = FastAPI()
 TEMP_DIR = os.path.join(os.path.dirname(__file__), "temp_audio")
 os.makedirs(TEMP_DIR, exist_ok=True)
 
-@app.post("/generate")
-async def generate_podcast_endpoint(data: dict):
-    """"""
-    try:
-        # Set environment variables
-        os.environ['OPENAI_API_KEY'] = data.get('openai_key')
-        os.environ['GEMINI_API_KEY'] = data.get('google_key')
-        os.environ['ELEVENLABS_API_KEY'] = data.get('elevenlabs_key')
-
-        # Load base configuration
-        base_config = load_base_config()
-        
-        # Get TTS model and its configuration from base config
-        tts_model = data.get('tts_model', base_config.get('text_to_speech', {}).get('default_tts_model', 'openai'))
-        tts_base_config = base_config.get('text_to_speech', {}).get(tts_model, {})
-        
-        # Get voices (use user-provided voices or fall back to defaults)
-        voices = data.get('voices', {})
-        default_voices = tts_base_config.get('default_voices', {})
-        
-        # Prepare user configuration
-        user_config = {
-            'creativity': float(data.get('creativity', base_config.get('creativity', 0.7))),
-            'conversation_style': data.get('conversation_style', base_config.get('conversation_style', [])),
-            'roles_person1': data.get('roles_person1', base_config.get('roles_person1')),
-            'roles_person2': data.get('roles_person2', base_config.get('roles_person2')),
-            'dialogue_structure': data.get('dialogue_structure', base_config.get('dialogue_structure', [])),
-            'podcast_name': data.get('name', base_config.get('podcast_name')),
-            'podcast_tagline': data.get('tagline', base_config.get('podcast_tagline')),
-            'output_language': data.get('output_language', base_config.get('output_language', 'English')),
-            'user_instructions': data.get('user_instructions', base_config.get('user_instructions', '')),
-            'engagement_techniques': data.get('engagement_techniques', base_config.get('engagement_techniques', [])),
-            'text_to_speech': {
-                'default_tts_model': tts_model,
-                'model': tts_base_config.get('model'),
-                'default_voices': {
-                    'question': voices.get('question', default_voices.get('question')),
-                    'answer': voices.get('answer', default_voices.get('answer'))
-                }
+# Number of podcasts generated concurrently; further jobs wait in the queue
+MAX_WORKERS = int(os.getenv("PODCASTFY_API_WORKERS", 2))
+# Finished jobs, and their audio files, are deleted this many seconds after they finish
+JOB_TTL_SECONDS = int(os.getenv("PODCASTFY_API_JOB_TTL", 3600))
+
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="podcastfy-job")
+jobs: Dict[str, Dict[str, Any]] = {}
+jobs_lock = threading.Lock()
+
+
+def run_generation(data: Dict[str, Any]) -> str:
+    """
+    Generate a podcast from a /generate request and copy it to TEMP_DIR.
+
+    Args:
+        data (Dict[str, Any]): The request body.
+
+    Returns:
+        str: URL of the generated audio file.
+    """
+    # Pass API keys with the call rather than through os.environ, which concurrent jobs share
+    api_keys = {
+        config_key: data[key]
+        for config_key, key in [('OPENAI_API_KEY', 'openai_key'), ('GEMINI_API_KEY', 'google_key'), ('ELEVENLABS_API_KEY', 'elevenlabs_key')]
+        if data.get(key)
+    }
+
+    # Load base configuration
+    base_config = load_base_config()
+    
+    # Get TTS model and its configuration from base config
+    tts_model = data.get('tts_model', base_config.get('text_to_speech', {}).get('default_tts_model', 'openai'))
+    tts_base_config = base_config.get('text_to_speech', {}).get(tts_model, {})
+    
+    # Get voices (use user-provided voices or fall back to defaults)
+    voices = data.get('voices', {})
+    default_voices = tts_base_config.get('default_voices', {})
+    
+    # Prepare user configuration
+    user_config = {
+        'creativity': float(data.get('creativity', base_config.get('creativity', 0.7))),
+        'conversation_style': data.get('conversation_style', base_config.get('conversation_style', [])),
+        'roles_person1': data.get('roles_person1', base_config.get('roles_person1')),
+        'roles_person2': data.get('roles_person2', base_config.get('roles_person2')),
+        'dialogue_structure': data.get('dialogue_structure', base_config.get('dialogue_structure', [])),
+        'podcast_name': data.get('name', base_config.get('podcast_name')),
+        'podcast_tagline': data.get('tagline', base_config.get('podcast_tagline')),
+        'output_language': data.get('output_language', base_config.get('output_language', 'English')),
+        'user_instructions': data.get('user_instructions', base_config.get('user_instructions', '')),
+        'engagement_techniques': data.get('engagement_techniques', base_config.get('engagement_techniques', [])),
+        'text_to_speech': {
+            'default_tts_model': tts_model,
+            'model': tts_base_config.get('model'),
+            'default_voices': {
+                'question': voices.get('question', default_voices.get('question')),
+                'answer': voices.get('answer', default_voices.get('answer'))
             }
         }
+    }
+
+    # print(user_config)
 
-        # print(user_config)
-
-        # Merge configurations
-        conversation_config = merge_configs(base_config, user_config)
-
-        # print(conversation_config)
-        
-
-        # Generate podcast
-        result = generate_podcast(
-            urls=data.get('urls', []),
-            conversation_config=conversation_config,
-            tts_model=tts_model,
-            longform=bool(data.get('is_long_form', False)),
-        )
-        # Handle the result
-        if isinstance(result, str) and os.path.isfile(result):
-            filename = f"podcast_{os.urandom(8).hex()}.mp3"
-            output_path = os.path.join(TEMP_DIR, filename)
-            shutil.copy2(result, output_path)
-            return {"audioUrl": f"/audio/{filename}"}
-        elif hasattr(result, 'audio_path'):
-            filename = f"podcast_{os.urandom(8).hex()}.mp3"
-            output_path = os.path.join(TEMP_DIR, filename)
-            shutil.copy2(result.audio_path, output_path)
-            return {"audioUrl": f"/audio/{filename}"}
-        else:
-            raise HTTPException(status_code=500, detail="Invalid result format")
+    # Merge configurations
+    conversation_config = merge_configs(base_config, user_config)
 
+    # print(conversation_config)
+    
+
+    # Generate podcast
+    result = generate_podcast(
+        urls=data.get('urls', []),
+        config=api_keys,
+        conversation_config=conversation_config,
+        tts_model=tts_model,
+        longform=bool(data.get('is_long_form', False)),
+    )
+    # Handle the result
+    if isinstance(result, str) and os.path.isfile(result):
+        audio_path = result
+    elif hasattr(result, 'audio_path'):
+        audio_path = result.audio_path
+    else:
+        raise ValueError("Invalid result format")
+
+    filename = f"podcast_{os.urandom(8).hex()}.mp3"
+    output_path = os.path.join(TEMP_DIR, filename)
+    shutil.copy2(audio_path, output_path)
+    return f"/audio/{filename}"
+
+
+def _update_job(job_id: str, **fields: Any) -> None:
+    """Update the fields of a job."""
+    with jobs_lock:
+        jobs[job_id].update(fields)
+
+
+def _run_job(job_id: str, data: Dict[str, Any]) -> None:
+    """Run a queued generation job on the worker pool and record its outcome."""
+    _update_job(job_id, status="running", startedAt=time.time())
+    try:
+        audio_url = run_generation(data)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.error(f"Job {job_id} failed: {str(e)}")
+        _update_job(job_id, status="failed", error=str(e), finishedAt=time.time())
+    else:
+        _update_job(job_id, status="completed", audioUrl=audio_url, finishedAt=time.time())
+
+
+def _prune_jobs() -> None:
+    """Forget jobs that finished more than JOB_TTL_SECONDS ago and delete their audio. Must hold jobs_lock."""
+    cutoff = time.time() - JOB_TTL_SECONDS
+    expired = [job_id for job_id, job in jobs.items() if job.get("finishedAt") and job["finishedAt"] < cutoff]
+    for job_id in expired:
+        job = jobs.pop(job_id)
+        if job.get("audioUrl"):
+            try:
+                os.remove(os.path.join(TEMP_DIR, os.path.basename(job["audioUrl"])))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete audio of expired job {job_id}: {str(e)}")
+
+
+def _get_job(job_id: str) -> Dict[str, Any]:
+    """Get a snapshot of a job, including its position in the queue while it waits."""
+    with jobs_lock:
+        # Polling also expires old jobs, so the TTL holds even when nothing new is submitted
+        _prune_jobs()
+        if job_id not in jobs:
+            raise HTTPException(status_code=404, detail="Job not found")
+        job = dict(jobs[job_id])
+        if job["status"] == "queued":
+            job["queuePosition"] = sum(
+                1 for other in jobs.values()
+                if other["status"] == "queued" and other["createdAt"] < job["createdAt"]
+            )
+    return job
+
+
+@app.post("/generate", status_code=202)
+async def generate_podcast_endpoint(data: dict):
+    """Enqueue a podcast generation job and return its ID."""
+    job_id = uuid.uuid4().hex
+    with jobs_lock:
+        _prune_jobs()
+        jobs[job_id] = {"jobId": job_id, "status": "queued", "createdAt": time.time()}
+    executor.submit(_run_job, job_id, data)
+    return {
+        "jobId": job_id,
+        "status": "queued",
+        "statusUrl": f"/jobs/{job_id}",
+        "resultUrl": f"/jobs/{job_id}/result",
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Get the status of a job: queued, running, completed or failed."""
+    return _get_job(job_id)
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Get the audio URL of a completed job. Returns 202 while the job is still pending."""
+    job = _get_job(job_id)
+    if job["status"] == "completed":
+        return {"audioUrl": job["audioUrl"]}
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    return JSONResponse(status_code=202, content=job)
 
 @app.get("/audio/{filename}")
 async def serve_audio(filename: str):
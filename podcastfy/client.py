@@ -85,14 +85,21 @@ def process_content(
                 is_local=is_local,
                 model_name=model_name,
                 api_key_label=api_key_label,
-                conversation_config=conv_config.to_dict()
+                conversation_config=conv_config.to_dict(),
+                api_key=getattr(config, api_key_label or "GEMINI_API_KEY", None) or None
             )
 
             combined_content = ""
             
             if urls:
                 logger.info(f"Processing {len(urls)} links")
-                contents = [content_extractor.extract_content(link) for link in urls]
+                results = content_extractor.extract_contents(urls)
+                failed = [result for result in results if not result.ok]
+                for result in failed:
+                    logger.error(f"Failed to extract {result.source}: {str(result.error)}")
+                if failed:
+                    raise failed[0].error
+                contents = [result.content for result in results]
                 combined_content += "\n\n".join(contents)
 
             if text:
@@ -299,7 +306,9 @@ def generate_podcast(
         transcript_file (Optional[str]): Path to a transcript file.
         tts_model (Optional[str]): TTS model to use ('openai' [default], 'elevenlabs', 'edge', or 'gemini').
         transcript_only (bool): Generate only a transcript without audio. Defaults to False.
-        config (Optional[Dict[str, Any]]): User-provided configuration dictionary.
+        config (Optional[Dict[str, Any]]): User-provided configuration dictionary. API keys
+            (GEMINI_API_KEY, OPENAI_API_KEY, ELEVENLABS_API_KEY) given here are used for this
+            call only and take precedence over the environment.
         conversation_config (Optional[Dict[str, Any]]): User-provided conversation configuration dictionary.
         image_paths (Optional[List[str]]): List of image file paths to process.
         is_local (bool): Whether to use a local LLM. Defaults to False.
@@ -7,6 +7,8 @@ provides methods to generate and save the generated content.
 """
 
 import os
+import hashlib
+import json
 from typing import Optional, Dict, Any, List
 import re
 
@@ -16,9 +18,13 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.llms.llamafile import Llamafile
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain import hub
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
 from podcastfy.utils.config_conversation import load_conversation_config
 from podcastfy.utils.config import load_config
+from podcastfy.utils.cache import DiskCache
+from podcastfy.utils.prompt_cache import pull_prompt
+from podcastfy.utils.segmenter import iter_chunk_spans, iter_sentence_spans
+from podcastfy.utils.tokens import CHARS_PER_TOKEN, estimate_tokens, token_stats
 import logging
 from langchain.prompts import HumanMessagePromptTemplate
 from abc import ABC, abstractmethod
@@ -34,6 +40,7 @@ class LLMBackend:
         max_output_tokens: int,
         model_name: str,
         api_key_label: str = "GEMINI_API_KEY",
+        api_key: Optional[str] = None,
     ):
         """
         Initialize the LLMBackend.
@@ -43,6 +50,8 @@ class LLMBackend:
                 temperature (float): The temperature for text generation.
                 max_output_tokens (int): The maximum number of output tokens.
                 model_name (str): The name of the model to use.
+                api_key_label (str): Environment variable holding the API key, used if api_key is not given.
+                api_key (Optional[str]): API key of the model provider.
         """
         self.is_local = is_local
         self.temperature = temperature
@@ -63,7 +72,7 @@ class LLMBackend:
         ):  # keeping original gemini as a special case while we build confidence on LiteLLM
 
             self.llm = ChatGoogleGenerativeAI(
-                api_key=os.environ["GEMINI_API_KEY"],
+                api_key=api_key or os.environ["GEMINI_API_KEY"],
                 model=model_name,
                 max_output_tokens=max_output_tokens,
                 **common_params,
@@ -72,10 +81,84 @@ class LLMBackend:
             self.llm = ChatLiteLLM(
                 model=self.model_name,
                 temperature=temperature,
-                api_key=os.environ[api_key_label],
+                api_key=api_key or os.environ[api_key_label],
             )
 
 
+class ChatContextWindow:
+    """
+    Bounded chat context for long-form generation.
+    
+    Keeps the most recent turns of the conversation verbatim within a token budget.
+    Older turns are folded into a running extractive summary (the first sentence
+    of each turn), so prompt size stays roughly constant as the conversation grows.
+    
+    Attributes:
+        token_budget (Optional[int]): Maximum estimated tokens of the rendered context.
+            None keeps the whole conversation.
+    """
+    
+    TURN_PATTERN = re.compile(r'<(Person[12])>(.*?)</\1>', re.DOTALL)
+    SUMMARY_SHARE = 0.25  # share of the token budget available to the summary
+    
+    def __init__(self, token_budget: Optional[int] = None):
+        self.token_budget = token_budget
+        self.turns: List[str] = []
+        self.summary: List[str] = []
+        self._turn_tokens = 0
+        self._summary_tokens = 0
+    
+    def add(self, response: str) -> None:
+        """
+        Add a generated conversation part, evicting old turns beyond the budget.
+        
+        Args:
+            response (str): Conversation part with Person1/Person2 tags
+        """
+        turns = [match.group(0) for match in self.TURN_PATTERN.finditer(response)]
+        for turn in turns or [response.strip()]:
+            self.turns.append(turn)
+            self._turn_tokens += estimate_tokens(turn)
+        
+        if not self.token_budget:
+            return
+        
+        summary_budget = int(self.token_budget * self.SUMMARY_SHARE)
+        # Always keep the last turn so the previous speaker can be determined
+        while len(self.turns) > 1 and self._turn_tokens > self.token_budget - summary_budget:
+            turn = self.turns.pop(0)
+            self._turn_tokens -= estimate_tokens(turn)
+            self._summarize(turn)
+        
+        while self.summary and self._summary_tokens > summary_budget:
+            self._summary_tokens -= estimate_tokens(self.summary.pop(0))
+    
+    def _summarize(self, turn: str) -> None:
+        """Add the first sentence of an evicted turn to the running summary."""
+        match = self.TURN_PATTERN.match(turn)
+        speaker, content = (match.group(1), match.group(2)) if match else ("", turn)
+        content = re.sub(r'<[^>]+>', '', content).strip()
+        if not content:
+            return
+        first_sentence = re.split(r'(?<=[.!?])\s+', content, maxsplit=1)[0]
+        line = f"- {speaker}: {first_sentence}" if speaker else f"- {first_sentence}"
+        self.summary.append(line)
+        self._summary_tokens += estimate_tokens(line)
+    
+    def render(self) -> str:
+        """
+        Render the context for the next prompt.
+        
+        Returns:
+            str: Summary of earlier turns, if any, followed by the most recent turns
+        """
+        recent = "\n".join(self.turns)
+        if not self.summary:
+            return recent
+        summary = "\n".join(self.summary)
+        return f"Summary of earlier conversation:\n{summary}\n\nMost recent conversation:\n{recent}"
+
+
 class LongFormContentGenerator:
     """
     Handles generation of long-form podcast conversations by breaking content into manageable chunks.
@@ -111,64 +194,98 @@ class LongFormContentGenerator:
         self.llm = llm
         self.max_num_chunks = config_conversation.get("max_num_chunks", 10)  # Default if not in config
         self.min_chunk_size = config_conversation.get("min_chunk_size", 200)  # Default if not in config
+        self.parallel = config_conversation.get("longform_parallel", False)
+        self.max_workers = config_conversation.get("longform_max_workers", 4)
+        self.context_tokens = config_conversation.get("longform_context_tokens")
+        self.max_chunk_tokens = config_conversation.get("longform_max_chunk_tokens")
+        self.chunk_token_stats: Dict[str, Any] = {}
 
     def __calculate_chunk_size(self, input_content: str) -> int:
         """
-        Calculate chunk size based on input content length.
+        Calculate the target chunk size in tokens based on input content length.
         
         Args:
             input_content: Input text content
                 
         Returns:
-            Calculated chunk size that ensures:
-            - Returns 1 if content length <= min_chunk_size
-            - Each chunk has at least min_chunk_size characters
+            Calculated chunk size in tokens that ensures:
+            - Returns the whole content size if it is at most min_chunk_size
+            - Each chunk has at least min_chunk_size (characters, converted to tokens)
             - Number of chunks is at most max_num_chunks
+            - Each chunk has at most longform_max_chunk_tokens, if set, even if this
+              results in more than max_num_chunks chunks
         """
-        input_length = len(input_content)
-        if input_length <= self.min_chunk_size:
-            return input_length
-        
-        maximum_chunk_size = input_length // self.max_num_chunks
-        if maximum_chunk_size >= self.min_chunk_size:
-            return maximum_chunk_size
+        input_tokens = estimate_tokens(input_content)
+        min_chunk_tokens = max(1, self.min_chunk_size // CHARS_PER_TOKEN)
+        if input_tokens <= min_chunk_tokens:
+            chunk_tokens = input_tokens
+        else:
+            maximum_chunk_tokens = input_tokens // self.max_num_chunks
+            if maximum_chunk_tokens >= min_chunk_tokens:
+                chunk_tokens = maximum_chunk_tokens
+            else:
+                # Calculate chunk size that maximizes size while maintaining minimum chunks
+                chunk_tokens = input_tokens // (input_tokens // min_chunk_tokens)
         
-        # Calculate chunk size that maximizes size while maintaining minimum chunks
-        return input_length // (input_length // self.min_chunk_size)
+        if self.max_chunk_tokens:
+            chunk_tokens = min(chunk_tokens, self.max_chunk_tokens)
+        return max(1, chunk_tokens)
 
-    def chunk_content(self, input_content: str, chunk_size: int) -> List[str]:
+    def chunk_content(self, input_content: str, chunk_tokens: int) -> List[str]:
         """
-        Split input content into manageable chunks while preserving context.
+        Split input content into chunks of whole sentences, packed up to a token budget.
+        
+        Sentences longer than the budget are split so that every chunk fits.
         
         Args:
             input_content (str): The input text to chunk
-            chunk_size (int): Maximum size of each chunk
+            chunk_tokens (int): Target number of tokens of each chunk
             
         Returns:
             List[str]: List of content chunks
         """
-        sentences = input_content.split('. ')
-        chunks = []
-        current_chunk = []
-        current_length = 0
-        
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            if current_length + sentence_length > chunk_size and current_chunk:
-                chunks.append('. '.join(current_chunk) + '.')
-                current_chunk = []
-                current_length = 0
-            current_chunk.append(sentence)
-            current_length += sentence_length
+        return [input_content[start:end] for start, end in iter_chunk_spans(input_content, chunk_tokens)]
+
+    def initial_context(self, input_content: str) -> str:
+        """
+        Build the context of the first conversation part from the opening of the source content.
+        
+        Args:
+            input_content (str): Input text for conversation
+            
+        Returns:
+            str: Leading whole sentences of the input within longform_context_tokens,
+                or the whole input if no budget is set
+        """
+        if not self.context_tokens:
+            return input_content
+        spans = iter_chunk_spans(input_content, self.context_tokens)
+        return next((input_content[start:end] for start, end in spans), "")
+
+    def build_outline(self, chunks: List[str]) -> str:
+        """
+        Build a compact outline of the source content, one line per conversation part.
+        
+        The outline is deterministic, so it can be computed upfront and shared by
+        all parts when they are generated in parallel.
+        
+        Args:
+            chunks (List[str]): Content chunks, one per conversation part
             
-        if current_chunk:
-            chunks.append('. '.join(current_chunk) + '.')
-        return chunks
+        Returns:
+            str: Outline listing the opening sentence of each part
+        """
+        lines = []
+        for i, chunk in enumerate(chunks, 1):
+            start, end = next(iter_sentence_spans(chunk), (0, 0))
+            lines.append(f"Part {i}: {chunk[start:end]}")
+        return "\n".join(lines)
 
     def enhance_prompt_params(self, prompt_params: Dict, 
                               part_idx: int, 
                               total_parts: int,
-                              chat_context: str) -> Dict:
+                              chat_context: str,
+                              parallel: bool = False) -> Dict:
         """
         Enhance prompt parameters for long-form content generation.
         
@@ -176,7 +293,10 @@ class LongFormContentGenerator:
             prompt_params (Dict): Original prompt parameters
             part_idx (int): Index of current conversation part
             total_parts (int): Total number of conversation parts
-            chat_context (str): Chat context from previous parts
+            chat_context (str): Chat context from previous parts, or the outline
+                of the source content if parts are generated in parallel
+            parallel (bool): Whether parts are generated in parallel, without
+                seeing each other
             
         Returns:
             Dict: Enhanced prompt parameters with part-specific instructions
@@ -196,6 +316,23 @@ class LongFormContentGenerator:
             Hence, avoid statemeents such as "we'll discuss after a short break.  Stay tuned" or "Okay, so, picking up where we left off".
         """ 
 
+        if parallel:
+            # Parts are generated concurrently, so the previous part isn't available.
+            # Fix the speaker order instead so that consecutive parts still alternate.
+            # The last part ends with Person1's good bye, so only its first speaker is fixed.
+            if part_idx == total_parts - 1:
+                speaker_order = "The first to speak must be <Person1>."
+            else:
+                speaker_order = "The first to speak must be <Person1> and the last to speak must be <Person2>."
+            COMMON_INSTRUCTIONS = f"""
+            An outline of the whole podcast conversation is given in CONTEXT. You are generating Part {part_idx+1} only.
+            Other parts are generated separately, so only discuss the below INPUT and do not cover topics of other parts.
+            The transition should be smooth and natural, as if continuing from the previous part. Avoid abrupt transitions.
+            {speaker_order}
+            This is a live conversation without any breaks.
+            Hence, avoid statemeents such as "we'll discuss after a short break.  Stay tuned" or "Okay, so, picking up where we left off".
+        """
+
         # Add part-specific instructions
         if part_idx == 0:
             enhanced_params["instruction"] = f"""
@@ -203,6 +340,10 @@ class LongFormContentGenerator:
             You are generating the Introduction part of a long podcast conversation.
             Don't cover any topics yet, just introduce yourself and the topic. Leave the rest for later parts, following these guidelines:
             """
+            if parallel:
+                enhanced_params["instruction"] += """
+            The outline of the whole conversation is given in CONTEXT. The last to speak must be <Person2>.
+            """
         elif part_idx == total_parts - 1:
             enhanced_params["instruction"] = f"""
             You are generating the last part of a long podcast conversation. 
@@ -240,11 +381,18 @@ class LongFormContentGenerator:
         chunk_size = self.__calculate_chunk_size(input_content)
 
         chunks = self.chunk_content(input_content, chunk_size)
-        conversation_parts = []
-        chat_context = input_content
         num_parts = len(chunks)
-        print(f"Generating {num_parts} parts")
+        self.chunk_token_stats = {"target": chunk_size, **token_stats(chunks)}
+        logger.info(f"Chunk tokens: {self.chunk_token_stats}")
+        print(f"Generating {num_parts} parts of {self.chunk_token_stats['min']}-{self.chunk_token_stats['max']} tokens")
+        
+        if self.parallel and num_parts > 1:
+            conversation_parts = self._generate_parts_parallel(chunks, prompt_params)
+            return self.stitch_conversations(conversation_parts)
         
+        conversation_parts = []
+        chat_context = self.initial_context(input_content)
+        context_window = ChatContextWindow(self.context_tokens)
         for i, chunk in enumerate(chunks):
             enhanced_params = self.enhance_prompt_params(
                 prompt_params,
@@ -254,11 +402,9 @@ class LongFormContentGenerator:
             )
             enhanced_params["input_text"] = chunk
             response = self.llm_chain.invoke(enhanced_params)
-            if i == 0:
-                chat_context = response
-            else:
-                chat_context = chat_context + response
-            print(f"Generated part {i+1}/{num_parts}: Size {len(chunk)} characters.")
+            context_window.add(response)
+            chat_context = context_window.render()
+            print(f"Generated part {i+1}/{num_parts}: Size {len(chunk)} characters, {self.chunk_token_stats['counts'][i]} tokens.")
             #print(f"[LLM-START] Step: {i+1} ##############################")
             #print(response)
             #print(f"[LLM-END] Step: {i+1} ##############################")
@@ -266,6 +412,41 @@ class LongFormContentGenerator:
 
         return self.stitch_conversations(conversation_parts)
     
+    def _generate_parts_parallel(self, chunks: List[str], prompt_params: Dict) -> List[str]:
+        """
+        Generate all conversation parts concurrently.
+        
+        Each part gets the outline of the source content as context instead of the
+        preceding parts, so no part waits for another.
+        
+        Args:
+            chunks (List[str]): Content chunks, one per conversation part
+            prompt_params (Dict): Base prompt parameters
+            
+        Returns:
+            List[str]: Conversation parts in chunk order
+        """
+        num_parts = len(chunks)
+        outline = self.build_outline(chunks)
+        batch_params = []
+        for i, chunk in enumerate(chunks):
+            enhanced_params = self.enhance_prompt_params(
+                prompt_params,
+                part_idx=i,
+                total_parts=num_parts,
+                chat_context=outline,
+                parallel=True
+            )
+            enhanced_params["input_text"] = chunk
+            batch_params.append(enhanced_params)
+        
+        # batch returns responses in input order
+        conversation_parts = self.llm_chain.batch(
+            batch_params, config={"max_concurrency": self.max_workers}
+        )
+        print(f"Generated {num_parts} parts in parallel.")
+        return conversation_parts
+    
     def stitch_conversations(self, parts: List[str]) -> str:
         """
         Combine conversation parts with smooth transitions.
@@ -562,8 +743,8 @@ class LongFormContentStrategy(ContentGenerationStrategy, ContentCleanerMixin):
             # Get prompt templates from hub
             logger.debug("Pulling prompt templates from hub")
             try:
-                clean_transcript_prompt = hub.pull(f"{self.content_generator_config['cleaner_prompt_template']}:{self.content_generator_config['cleaner_prompt_commit']}")
-                rewrite_prompt = hub.pull(f"{self.content_generator_config['rewriter_prompt_template']}:{self.content_generator_config['rewriter_prompt_commit']}")
+                clean_transcript_prompt = pull_prompt(self.content_generator_config['cleaner_prompt_template'], self.content_generator_config['cleaner_prompt_commit'])
+                rewrite_prompt = pull_prompt(self.content_generator_config['rewriter_prompt_template'], self.content_generator_config['rewriter_prompt_commit'])
                 logger.debug("Successfully pulled prompt templates")
             except Exception as e:
                 logger.error(f"Error pulling prompt templates: {str(e)}")
@@ -708,14 +889,17 @@ class ContentGenerator:
         is_local: bool=False, 
         model_name: str="gemini-1.5-pro-latest", 
         api_key_label: str="GEMINI_API_KEY",
-        conversation_config: Optional[Dict[str, Any]] = None
+        conversation_config: Optional[Dict[str, Any]] = None,
+        api_key: Optional[str] = None
     ):
         """
         Initialize the ContentGenerator.
 
         Args:
-                api_key (str): API key for Google's Generative AI.
+                api_key_label (str): Environment variable holding the LLM API key, used if api_key is not given.
                 conversation_config (Optional[Dict[str, Any]]): Custom conversation configuration.
+                api_key (Optional[str]): LLM API key. Takes precedence over the environment, so
+                        concurrent generators can use different credentials.
         """
         #os.environ["GOOGLE_API_KEY"] = api_key
         self.config = load_config()
@@ -749,9 +933,13 @@ class ContentGenerator:
             ),
             model_name=model_name,
             api_key_label=api_key_label,
+            api_key=api_key,
         )
 
         self.llm = llm_backend.llm
+        self.model_name = model_name
+        self.temperature = llm_backend.temperature
+        self.response_cache = self._setup_response_cache()
 
 
 
@@ -769,6 +957,71 @@ class ContentGenerator:
             )
         }
 
+    def _setup_response_cache(self) -> Optional[DiskCache]:
+        """Set up the on-disk LLM response cache if enabled in the config."""
+        cache_config = self.content_generator_config.get("response_cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        max_size_mb = cache_config.get("max_size_mb")
+        ttl_hours = cache_config.get("ttl_hours")
+        return DiskCache.shared(
+            cache_config.get("directory", "./data/cache/llm"),
+            max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+            ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+        )
+
+    def _response_cache_key(self, prompt_value) -> str:
+        """
+        Build the response cache key for a rendered prompt.
+        
+        Keyed on model, temperature and the rendered messages. Image inputs are
+        keyed on a digest of the file contents when the image is a local file.
+        """
+        messages = []
+        for message in prompt_value.to_messages():
+            content = message.content
+            if isinstance(content, list):
+                content = [self._digest_image(part) for part in content]
+            messages.append([message.type, content])
+        return DiskCache.make_key(
+            self.model_name, self.temperature, json.dumps(messages, sort_keys=True)
+        )
+
+    @staticmethod
+    def _digest_image(part: Any) -> Any:
+        """Replace a local image path in a message part with a digest of the image."""
+        if not isinstance(part, dict) or part.get("type") != "image_url":
+            return part
+        url = part.get("image_url", {}).get("url", "")
+        if os.path.isfile(url):
+            with open(url, "rb") as f:
+                url = hashlib.sha256(f.read()).hexdigest()
+        return {**part, "image_url": {**part["image_url"], "url": url}}
+
+    def _with_response_cache(self, llm_chain: Runnable, bypass_cache: bool = False) -> Runnable:
+        """
+        Wrap an LLM chain so that responses are served from and stored in the response cache.
+        
+        Args:
+            llm_chain (Runnable): Chain from a rendered prompt to the response text
+            bypass_cache (bool): Always call the LLM, but still store the new response
+            
+        Returns:
+            Runnable: The cached chain
+        """
+        def invoke(prompt_value, config: RunnableConfig) -> str:
+            key = self._response_cache_key(prompt_value)
+            if not bypass_cache:
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    logger.info("Using cached LLM response")
+                    return cached.decode("utf-8")
+            response = llm_chain.invoke(prompt_value, config)
+            self.response_cache.set(key, response.encode("utf-8"))
+            return response
+        
+        return RunnableLambda(invoke)
+
     def __compose_prompt(self, num_images: int, longform: bool=False):
         """
         Compose the prompt for the LLM based on the content list.
@@ -787,7 +1040,7 @@ class ContentGenerator:
             template = base_template
             commit = base_commit
 
-        prompt_template = hub.pull(f"{template}:{commit}")
+        prompt_template = pull_prompt(template, commit)
 
         image_path_keys = []
         messages = []
@@ -839,7 +1092,8 @@ class ContentGenerator:
         input_texts: str = "",
         image_file_paths: List[str] = [],
         output_filepath: Optional[str] = None,
-        longform: bool = False
+        longform: bool = False,
+        bypass_cache: bool = False
     ) -> str:
         """
         Generate Q&A content based on input texts.
@@ -852,6 +1106,7 @@ class ContentGenerator:
             model_name (str): Model name to use for generation.
             api_key_label (str): Environment variable name for API key.
             longform (bool): Whether to generate long-form content. Defaults to False.
+            bypass_cache (bool): Call the LLM even if the response cache has a response. Defaults to False.
 
         Returns:
             str: Generated conversation content
@@ -871,7 +1126,10 @@ class ContentGenerator:
             num_images = 0 if self.is_local else len(image_file_paths)
             self.prompt_template, image_path_keys = self.__compose_prompt(num_images, longform)
             self.parser = StrOutputParser()
-            self.chain = self.prompt_template | self.llm | self.parser
+            llm_chain = self.llm | self.parser
+            if self.response_cache:
+                llm_chain = self._with_response_cache(llm_chain, bypass_cache)
+            self.chain = self.prompt_template | llm_chain
 
 
             # Prepare parameters using strategy
@@ -4,19 +4,43 @@ Content Extractor Module
 This module provides functionality to extract content from various sources including
 websites, YouTube videos, and PDF files. It serves as a central hub for content
 extraction, delegating to specialized extractors based on the source type.
+Extracted content can be cached on disk, keyed on a fingerprint of the source.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
 import re
-from typing import List, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urlparse
 from .youtube_transcriber import YouTubeTranscriber
 from .website_extractor import WebsiteExtractor
 from .pdf_extractor import PDFExtractor
+from podcastfy.utils.cache import DiskCache
 from podcastfy.utils.config import load_config
 
 logger = logging.getLogger(__name__)
 
+# Shared by all extractors, so the per-host limit holds across concurrent jobs
+_host_semaphores: Dict[Tuple[str, int], threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+class ExtractionResult(NamedTuple):
+	"""Outcome of extracting a single source in a batch."""
+	source: str
+	content: Optional[str] = None
+	error: Optional[Exception] = None
+
+	@property
+	def ok(self) -> bool:
+		"""Whether the source was extracted successfully."""
+		return self.error is None
+
 class ContentExtractor:
 	def __init__(self):
 		"""
@@ -27,6 +51,73 @@ class ContentExtractor:
 		self.pdf_extractor = PDFExtractor()
 		self.config = load_config()
 		self.content_extractor_config = self.config.get('content_extractor', {})
+		self.max_workers = self.content_extractor_config.get('max_workers', 8)
+		self.max_per_host = self.content_extractor_config.get('max_per_host', 2)
+		self.cache = self._setup_cache()
+		# Cached content is only reused if it was extracted with the same cleaning settings
+		self.extraction_settings = DiskCache.make_key(
+			self.config.get('website_extractor'), self.config.get('youtube_transcriber')
+		)
+
+	def _setup_cache(self) -> Optional[DiskCache]:
+		"""Set up the on-disk extraction cache if enabled in the config."""
+		cache_config = self.content_extractor_config.get('cache', {})
+		if not cache_config.get('enabled', False):
+			return None
+		max_size_mb = cache_config.get('max_size_mb')
+		ttl_hours = cache_config.get('ttl_hours')
+		return DiskCache.shared(
+			cache_config.get('directory', './data/cache/extraction'),
+			max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+			ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+		)
+
+	def _get_fingerprint(self, source: str) -> Dict[str, Any]:
+		"""
+		Get the fingerprint identifying the current version of a source.
+
+		Local files are identified by a hash of their contents. Web pages are identified
+		by their URL and, if the server provides them, their ETag and Last-Modified
+		headers, which are fetched with a HEAD request. Other URLs, such as YouTube
+		videos, are identified by their URL alone and rely on the cache TTL.
+		"""
+		if os.path.isfile(source):
+			digest = hashlib.sha256()
+			with open(source, 'rb') as f:
+				for block in iter(lambda: f.read(1024 * 1024), b''):
+					digest.update(block)
+			return {'file_sha256': digest.hexdigest()}
+
+		fingerprint: Dict[str, Any] = {'url': source}
+		if self.is_url(source) and not self._is_youtube(source):
+			try:
+				url = self.website_extractor.normalize_url(source)
+				response = self.website_extractor.session.head(
+					url,
+					headers={'User-Agent': self.website_extractor.user_agent},
+					timeout=self.website_extractor.timeout,
+					allow_redirects=True,
+				)
+				if response.ok:
+					fingerprint['etag'] = response.headers.get('ETag')
+					fingerprint['last_modified'] = response.headers.get('Last-Modified')
+			except Exception as e:
+				logger.debug(f"Could not fetch validators of {source}: {str(e)}")
+		return fingerprint
+
+	def _is_revalidated_page(self, source: str) -> bool:
+		"""Check whether a source is a web page that the website extractor's HTTP cache revalidates."""
+		return (
+			self.website_extractor.http_cache is not None
+			and not os.path.isfile(source)
+			and not source.lower().endswith('.pdf')
+			and self.is_url(source)
+			and not self._is_youtube(source)
+		)
+
+	def _is_youtube(self, source: str) -> bool:
+		"""Check whether a URL source is a YouTube video."""
+		return any(pattern in source for pattern in self.content_extractor_config['youtube_url_patterns'])
 
 	def is_url(self, source: str) -> bool:
 		"""
@@ -48,12 +139,18 @@ class ContentExtractor:
 		except ValueError:
 			return False
 
-	def extract_content(self, source: str) -> str:
+	def extract_content(self, source: str, use_cache: bool = True) -> str:
 		"""
 		Extract content from various sources.
 
+		If the extraction cache is enabled, content is reused as long as the source's
+		fingerprint is unchanged and the entry hasn't expired. Web pages bypass it when
+		the website extractor's HTTP cache is enabled, since that already revalidates
+		them with a conditional GET.
+
 		Args:
 			source (str): URL or file path of the content source.
+			use_cache (bool): Whether to use the extraction cache, if enabled. Defaults to True.
 
 		Returns:
 			str: Extracted text content.
@@ -61,11 +158,48 @@ class ContentExtractor:
 		Raises:
 			ValueError: If the source type is unsupported.
 		"""
+		if self.cache is None or not use_cache or self._is_revalidated_page(source):
+			return self._extract_content(source)
+
+		key, fingerprint, content = self._get_cached(source)
+		if content is not None:
+			return content
+
+		content = self._extract_content(source)
+		self._set_cached(key, source, fingerprint, content)
+		return content
+
+	def _get_cached(self, source: str) -> Tuple[str, Dict[str, Any], Optional[str]]:
+		"""Get the cache key and fingerprint of a source, and its cached content or None."""
+		fingerprint = self._get_fingerprint(source)
+		key = DiskCache.make_key(self.extraction_settings, json.dumps(fingerprint, sort_keys=True))
+		cached = self.cache.get(key)
+		if cached is not None:
+			try:
+				content = json.loads(cached)['content']
+				logger.info(f"Using cached content of {source}")
+				return key, fingerprint, content
+			except (ValueError, KeyError):
+				logger.warning(f"Ignoring unreadable cache entry for {source}")
+		return key, fingerprint, None
+
+	def _set_cached(self, key: str, source: str, fingerprint: Dict[str, Any], content: str) -> None:
+		"""Store the extracted content of a source in the cache."""
+		entry = {
+			'source': source,
+			'fingerprint': fingerprint,
+			'extracted_at': time.time(),
+			'content': content,
+		}
+		self.cache.set(key, json.dumps(entry).encode('utf-8'))
+
+	def _extract_content(self, source: str) -> str:
+		"""Extract content from a source without using the cache."""
 		try:
 			if source.lower().endswith('.pdf'):
 				return self.pdf_extractor.extract_content(source)
 			elif self.is_url(source):
-				if any(pattern in source for pattern in self.content_extractor_config['youtube_url_patterns']):
+				if self._is_youtube(source):
 					return self.youtube_transcriber.extract_transcript(source)
 				else:
 					return self.website_extractor.extract_content(source)
@@ -75,6 +209,140 @@ class ContentExtractor:
 			logger.error(f"Error extracting content from {source}: {str(e)}")
 			raise
 	
+	def _get_host(self, source: str) -> str:
+		"""Get the host of a URL source, or an empty string for local files."""
+		if source.lower().endswith('.pdf') and not source.startswith(('http://', 'https://')):
+			return ''
+		if not source.startswith(('http://', 'https://')):
+			source = 'https://' + source
+		try:
+			return urlparse(source).netloc.lower()
+		except ValueError:
+			return ''
+
+	def _get_host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+		"""Get the process-wide semaphore limiting concurrent requests to a host."""
+		key = (host, self.max_per_host)
+		with _host_semaphores_lock:
+			if key not in _host_semaphores:
+				_host_semaphores[key] = threading.BoundedSemaphore(self.max_per_host)
+			return _host_semaphores[key]
+
+	def _extract_result(self, source: str) -> ExtractionResult:
+		"""Extract a single source, capturing any error in the result."""
+		host = self._get_host(source)
+		try:
+			if host:
+				with self._get_host_semaphore(host):
+					content = self.extract_content(source)
+			else:
+				content = self.extract_content(source)
+			return ExtractionResult(source, content=content)
+		except Exception as e:
+			return ExtractionResult(source, error=e)
+
+	def _is_youtube_source(self, source: str) -> bool:
+		"""Check whether a source is extracted by the YouTube transcriber."""
+		return not source.lower().endswith('.pdf') and self.is_url(source) and self._is_youtube(source)
+
+	def _partition_sources(self, sources: List[str]) -> Tuple[List[int], List[int]]:
+		"""Split source indices into YouTube videos and all other sources."""
+		youtube = [i for i, source in enumerate(sources) if self._is_youtube_source(source)]
+		youtube_set = set(youtube)
+		return youtube, [i for i in range(len(sources)) if i not in youtube_set]
+
+	def _extract_youtube_results(self, sources: List[str]) -> List[ExtractionResult]:
+		"""
+		Extract YouTube sources in one batch, so links to the same video are fetched once.
+
+		Sources found in the extraction cache are not fetched again.
+		"""
+		results: Dict[int, ExtractionResult] = {}
+		pending: List[Tuple[int, Optional[str], Optional[Dict[str, Any]]]] = []
+		for i, source in enumerate(sources):
+			if self.cache is None:
+				pending.append((i, None, None))
+				continue
+			key, fingerprint, content = self._get_cached(source)
+			if content is not None:
+				results[i] = ExtractionResult(source, content=content)
+			else:
+				pending.append((i, key, fingerprint))
+
+		transcripts = self.youtube_transcriber.extract_transcripts(
+			[sources[i] for i, _, _ in pending], return_exceptions=True
+		)
+		for (i, key, fingerprint), transcript in zip(pending, transcripts):
+			if isinstance(transcript, Exception):
+				results[i] = ExtractionResult(sources[i], error=transcript)
+				continue
+			if key is not None:
+				self._set_cached(key, sources[i], fingerprint, transcript)
+			results[i] = ExtractionResult(sources[i], content=transcript)
+		return [results[i] for i in range(len(sources))]
+
+	def extract_contents(self, sources: List[str], max_workers: Optional[int] = None) -> List[ExtractionResult]:
+		"""
+		Extract content from multiple sources concurrently.
+
+		Sources are extracted by a bounded worker pool, with at most max_per_host
+		concurrent requests to any one host. YouTube videos are fetched in one batch
+		by the YouTube transcriber, up to youtube_transcriber.max_workers at a time,
+		so duplicate links are fetched once. A failing source does not affect the others.
+
+		Args:
+			sources (List[str]): URLs or file paths of the content sources.
+			max_workers (Optional[int]): Maximum number of concurrent extractions.
+				Defaults to the content_extractor config.
+
+		Returns:
+			List[ExtractionResult]: One result per source, in input order.
+		"""
+		if not sources:
+			return []
+		youtube, others = self._partition_sources(sources)
+		results: List[Optional[ExtractionResult]] = [None] * len(sources)
+		workers = max(1, min(max_workers or self.max_workers, len(others)))
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			futures = {i: executor.submit(self._extract_result, sources[i]) for i in others}
+			# The YouTube batch runs in this thread while the pool extracts the other sources
+			if youtube:
+				for i, result in zip(youtube, self._extract_youtube_results([sources[i] for i in youtube])):
+					results[i] = result
+			for i, future in futures.items():
+				results[i] = future.result()
+		return results
+
+	async def aextract_contents(self, sources: List[str], max_workers: Optional[int] = None) -> List[ExtractionResult]:
+		"""
+		Asynchronously extract content from multiple sources.
+
+		Same as extract_contents, but awaitable from an event loop without blocking it.
+
+		Args:
+			sources (List[str]): URLs or file paths of the content sources.
+			max_workers (Optional[int]): Maximum number of concurrent extractions.
+				Defaults to the content_extractor config.
+
+		Returns:
+			List[ExtractionResult]: One result per source, in input order.
+		"""
+		semaphore = asyncio.Semaphore(max(1, max_workers or self.max_workers))
+
+		async def extract(source: str) -> ExtractionResult:
+			async with semaphore:
+				return await asyncio.to_thread(self._extract_result, source)
+
+		youtube, others = self._partition_sources(sources)
+		youtube_results, *other_results = await asyncio.gather(
+			asyncio.to_thread(self._extract_youtube_results, [sources[i] for i in youtube]),
+			*(extract(sources[i]) for i in others),
+		)
+		results: List[Optional[ExtractionResult]] = [None] * len(sources)
+		for i, result in zip(youtube + others, list(youtube_results) + other_results):
+			results[i] = result
+		return results
+
 	def generate_topic_content(self, topic: str) -> str:
 		"""
 		Generate content based on a given topic using a generative model.
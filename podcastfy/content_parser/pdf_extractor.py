@@ -4,36 +4,171 @@ PDF Extractor Module
 This module provides functionality to extract text content from PDF files.
 It handles the reading of PDF files, text extraction, and normalization of
 the extracted content, including handling of special characters and accents.
+Pages can be read incrementally, and large documents can be split into page ranges
+extracted in parallel worker processes.
+
+Parallel extraction is off by default (pdf_extractor.max_workers: 1). Worker
+processes are spawned, so they re-import the main module: scripts that enable it
+must guard their entry point with `if __name__ == "__main__":`.
 """
 
 import pymupdf
 import logging
+import multiprocessing
 import os
+import threading
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional, Tuple
+from podcastfy.utils.config import load_config
 
 logger = logging.getLogger(__name__)
 
+# One process pool is shared by all extractions, so concurrent extractions (e.g.
+# ContentExtractor.extract_contents) don't each start their own worker processes
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+	"""
+	Get the shared process pool with at least the given number of workers.
+
+	A smaller pool is replaced by a larger one; work already submitted to it still finishes.
+	"""
+	global _process_pool, _process_pool_workers
+	with _process_pool_lock:
+		if _process_pool is None or _process_pool_workers < workers:
+			if _process_pool is not None:
+				_process_pool.shutdown(wait=False)
+			# Spawn rather than fork, as the caller may be running other threads
+			context = multiprocessing.get_context('spawn')
+			_process_pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+			_process_pool_workers = workers
+		return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+	"""Shut down a failed shared process pool so the next parallel extraction starts a new one."""
+	global _process_pool, _process_pool_workers
+	with _process_pool_lock:
+		if _process_pool is pool:
+			_process_pool = None
+			_process_pool_workers = 0
+	pool.shutdown(wait=False, cancel_futures=True)
+
+
+def normalize_text(text: str) -> str:
+	"""Normalize text to handle special characters and separate accents (NFKD)."""
+	return unicodedata.normalize('NFKD', text)
+
+
+def _iter_normalized_pages(doc: pymupdf.Document) -> Iterator[str]:
+	"""Yield the normalized text of each page of an open document."""
+	for page in doc:
+		yield normalize_text(page.get_text())
+
+
+def extract_page_range(file_path: str, start: int, end: int) -> str:
+	"""
+	Extract the normalized text of a range of pages.
+
+	Defined at module level so that it can run in a worker process.
+
+	Args:
+		file_path (str): Path to the PDF file.
+		start (int): Index of the first page.
+		end (int): Index after the last page.
+
+	Returns:
+		str: Normalized text of the pages, separated by spaces.
+	"""
+	with pymupdf.open(file_path) as doc:
+		return " ".join(normalize_text(doc[i].get_text()) for i in range(start, end))
+
+
 class PDFExtractor:
-	def extract_content(self, file_path: str) -> str:
+	def __init__(self):
+		"""
+		Initialize the PDFExtractor.
+		"""
+		self.config = load_config()
+		self.pdf_extractor_config = self.config.get('pdf_extractor', {})
+		self.max_workers = self.pdf_extractor_config.get('max_workers', 1)
+		self.parallel_min_pages = self.pdf_extractor_config.get('parallel_min_pages', 100)
+
+	def iter_pages(self, file_path: str) -> Iterator[str]:
+		"""
+		Yield the normalized text of each page of a PDF file, one page at a time.
+
+		Args:
+			file_path (str): Path to the PDF file.
+
+		Yields:
+			str: Normalized text of the next page.
+		"""
+		with pymupdf.open(file_path) as doc:
+			yield from _iter_normalized_pages(doc)
+
+	def _get_page_ranges(self, page_count: int, workers: int) -> List[Tuple[int, int]]:
+		"""Split pages into one contiguous range per worker."""
+		size, remainder = divmod(page_count, workers)
+		ranges = []
+		start = 0
+		for i in range(workers):
+			end = start + size + (1 if i < remainder else 0)
+			ranges.append((start, end))
+			start = end
+		return ranges
+
+	def _extract_parallel(self, file_path: str, page_count: int, workers: int) -> str:
+		"""Extract page ranges in the shared worker processes and join them in page order."""
+		ranges = self._get_page_ranges(page_count, workers)
+		logger.debug(f"Extracting {page_count} pages of {file_path} in {workers} page ranges")
+		pool = _get_process_pool(workers)
+		try:
+			parts = pool.map(extract_page_range, [file_path] * workers, *zip(*ranges))
+			return " ".join(parts)
+		except BrokenProcessPool:
+			# Only a dead pool is discarded; an error raised by a worker leaves the pool usable
+			_discard_process_pool(pool)
+			raise
+
+	def extract_content(self, file_path: str, max_workers: Optional[int] = None) -> str:
 		"""
 		Extract text content from a PDF file, handling foreign characters and special characters.
 		Accents are removed from the text.
 
+		Documents with at least parallel_min_pages pages are split into page ranges
+		extracted by up to max_workers processes.
+
 		Args:
 			file_path (str): Path to the PDF file.
+			max_workers (Optional[int]): Maximum number of worker processes. Defaults to the config.
 
 		Returns:
 			str: Extracted text content with accents removed and properly handled characters.
 		"""
 		try:
-			doc = pymupdf.open(file_path)
-			content = " ".join(page.get_text() for page in doc)
-			doc.close()
-			
-			# Normalize the text to handle special characters and remove accents
-			normalized_content = unicodedata.normalize('NFKD', content)
-
-			return normalized_content
+			with pymupdf.open(file_path) as doc:
+				page_count = doc.page_count
+				workers = min(max_workers or self.max_workers, page_count)
+				if workers <= 1 or page_count < self.parallel_min_pages:
+					# Pages are normalized one at a time. Pages are joined by a space, which
+					# normalization leaves alone, so this matches normalizing the joined text.
+					return " ".join(_iter_normalized_pages(doc))
+
+			try:
+				return self._extract_parallel(file_path, page_count, workers)
+			except Exception as e:
+				logger.warning(
+					f"Parallel PDF extraction failed, extracting in-process: {str(e)}. "
+					"Spawned workers re-import the main module, which must guard its entry point "
+					"with `if __name__ == \"__main__\":`, or set pdf_extractor.max_workers to 1."
+				)
+			return " ".join(self.iter_pages(file_path))
 		except Exception as e:
 			logger.error(f"Error extracting PDF content: {str(e)}")
 			raise
@@ -2,20 +2,59 @@
 Website Extractor Module
 
 This module is responsible for extracting clean text content from websites using
-BeautifulSoup for local HTML parsing instead of the Jina AI API.
+BeautifulSoup for local HTML parsing instead of the Jina AI API. Pages are fetched
+with a shared, pooled HTTP session, and extracted content is cached on disk together
+with the page's ETag/Last-Modified validators so that unchanged pages are revalidated
+with a conditional request instead of being downloaded and parsed again.
 """
 
 import requests
 import re
 import html
+import json
 import logging
+import threading
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from requests.adapters import HTTPAdapter
+from podcastfy.utils.cache import DiskCache
 from podcastfy.utils.config import load_config
-from typing import List
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Parser used when the configured one is not installed. It ships with Python.
+FALLBACK_PARSER = 'html.parser'
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_maxsize: int = 10) -> requests.Session:
+	"""
+	Get the HTTP session shared by all website extractors in the process.
+
+	Args:
+		pool_maxsize (int): Maximum number of connections kept alive per host.
+			Only used when the session is first created.
+
+	Returns:
+		requests.Session: The shared session.
+	"""
+	global _session
+	with _session_lock:
+		if _session is None:
+			session = requests.Session()
+			adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+			session.mount('http://', adapter)
+			session.mount('https://', adapter)
+			_session = session
+		return _session
+
+
 class WebsiteExtractor:
 	def __init__(self):
 		"""
@@ -27,6 +66,70 @@ class WebsiteExtractor:
 		self.user_agent = self.website_extractor_config.get('user_agent', 'Mozilla/5.0')
 		self.timeout = self.website_extractor_config.get('timeout', 10)
 		self.remove_patterns = self.website_extractor_config.get('markdown_cleaning', {}).get('remove_patterns', [])
+		self.compiled_remove_patterns = [re.compile(pattern) for pattern in self.remove_patterns]
+		self.parser = self._resolve_parser(self.website_extractor_config.get('parser', 'lxml'))
+		self.session = get_session(self.website_extractor_config.get('pool_maxsize', 10))
+		self.http_cache = self._setup_http_cache()
+		# Cached content is only reused if it was extracted with the same cleaning settings
+		self.extraction_settings = DiskCache.make_key(self.unwanted_tags, self.remove_patterns, self.parser)
+
+	@staticmethod
+	def _resolve_parser(parser: str) -> str:
+		"""
+		Get the BeautifulSoup parser to use, falling back to html.parser if the configured one is not installed.
+
+		Args:
+			parser (str): Configured parser, e.g. 'lxml' or 'html.parser'.
+
+		Returns:
+			str: An available parser.
+		"""
+		if builder_registry.lookup(parser) is None:
+			logger.info(f"HTML parser '{parser}' is not installed, using '{FALLBACK_PARSER}'")
+			return FALLBACK_PARSER
+		return parser
+
+	def _setup_http_cache(self) -> Optional[DiskCache]:
+		"""Set up the on-disk HTTP cache if enabled in the config."""
+		cache_config = self.website_extractor_config.get('http_cache', {})
+		if not cache_config.get('enabled', False):
+			return None
+		max_size_mb = cache_config.get('max_size_mb')
+		return DiskCache.shared(
+			cache_config.get('directory', './data/cache/http'),
+			max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+		)
+
+	def _get_cached(self, url: str) -> Optional[Dict[str, Any]]:
+		"""Get the cached validators and content of a URL, if any."""
+		if self.http_cache is None:
+			return None
+		cached = self.http_cache.get(DiskCache.make_key(url))
+		if cached is None:
+			return None
+		try:
+			entry = json.loads(cached)
+		except ValueError:
+			return None
+		if entry.get('settings') != self.extraction_settings:
+			return None
+		return entry
+
+	def _set_cached(self, url: str, response: requests.Response, content: str) -> None:
+		"""Cache the extracted content of a URL if the response can be revalidated."""
+		if self.http_cache is None:
+			return
+		etag = response.headers.get('ETag')
+		last_modified = response.headers.get('Last-Modified')
+		if not etag and not last_modified:
+			return
+		entry = {
+			'etag': etag,
+			'last_modified': last_modified,
+			'settings': self.extraction_settings,
+			'content': content,
+		}
+		self.http_cache.set(DiskCache.make_key(url), json.dumps(entry).encode('utf-8'))
 
 	def extract_content(self, url: str) -> str:
 		"""
@@ -45,21 +148,23 @@ class WebsiteExtractor:
 			# Normalize the URL
 			normalized_url = self.normalize_url(url)
 
-			# Request the webpage
+			# Request the webpage, revalidating any cached copy
 			headers = {'User-Agent': self.user_agent}
-			response = requests.get(normalized_url, headers=headers, timeout=self.timeout)
+			cached = self._get_cached(normalized_url)
+			if cached:
+				if cached.get('etag'):
+					headers['If-None-Match'] = cached['etag']
+				if cached.get('last_modified'):
+					headers['If-Modified-Since'] = cached['last_modified']
+			response = self.session.get(normalized_url, headers=headers, timeout=self.timeout)
+			if cached and response.status_code == 304:
+				logger.debug(f"Using cached content of {normalized_url}")
+				return cached['content']
 			response.raise_for_status()  # Raise an exception for bad status codes
 
-			# Parse the page content with BeautifulSoup
-			soup = BeautifulSoup(response.text, 'html.parser')
-
-			# Remove unwanted elements
-			self.remove_unwanted_elements(soup)
-
-			# Extract and clean the text content
-			raw_text = soup.get_text(separator="\n")  # Get all text content
-			cleaned_content = self.clean_content(raw_text)
+			cleaned_content = self.extract_from_html(response.text)
 
+			self._set_cached(normalized_url, response, cleaned_content)
 			return cleaned_content
 		except requests.RequestException as e:
 			logger.error(f"Failed to extract content from {url}: {str(e)}")
@@ -94,6 +199,26 @@ class WebsiteExtractor:
 
 		return parsed.geturl()
 
+	def extract_from_html(self, html_text: str) -> str:
+		"""
+		Extract clean text content from an HTML document.
+
+		Args:
+			html_text (str): The HTML document.
+
+		Returns:
+			str: Extracted clean text content.
+		"""
+		# Parse the page content with BeautifulSoup
+		soup = BeautifulSoup(html_text, self.parser)
+
+		# Remove unwanted elements
+		self.remove_unwanted_elements(soup)
+
+		# Extract and clean the text content
+		raw_text = soup.get_text(separator="\n")  # Get all text content
+		return self.clean_content(raw_text)
+
 	def remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
 		"""
 		Remove unwanted elements from the BeautifulSoup object.
@@ -101,8 +226,12 @@ class WebsiteExtractor:
 		Args:
 			soup (BeautifulSoup): The BeautifulSoup object to clean.
 		"""
-		for tag in self.unwanted_tags:
-			for element in soup.find_all(tag):
+		if not self.unwanted_tags:
+			return
+		# A single walk finds elements of all unwanted tags
+		for element in soup.find_all(self.unwanted_tags):
+			# Elements nested in an already removed element are gone too
+			if not element.decomposed:
 				element.decompose()
 
 	def clean_content(self, content: str) -> str:
@@ -119,15 +248,13 @@ class WebsiteExtractor:
 		# Decode HTML entities
 		cleaned_content = html.unescape(content)
 
-		# Remove extra whitespace
-		cleaned_content = re.sub(r'\s+', ' ', cleaned_content)
-
-		# Remove extra newlines
-		cleaned_content = re.sub(r'\n{3,}', '\n\n', cleaned_content)
+		# Remove extra whitespace. This also collapses newlines, so no separate newline pass is needed.
+		cleaned_content = WHITESPACE_PATTERN.sub(' ', cleaned_content)
 
-		# Apply custom cleaning patterns from config
-		for pattern in self.remove_patterns:
-			cleaned_content = re.sub(pattern, '', cleaned_content)
+		# Apply custom cleaning patterns from config. Patterns run one after another,
+		# since a pattern may match text left behind by an earlier one.
+		for pattern in self.compiled_remove_patterns:
+			cleaned_content = pattern.sub('', cleaned_content)
 
 		return cleaned_content.strip()
 
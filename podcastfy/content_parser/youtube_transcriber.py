@@ -3,19 +3,127 @@ YouTube Transcriber Module
 
 This module is responsible for extracting and cleaning transcripts from YouTube videos.
 It uses the YouTube Transcript API to fetch transcripts and provides functionality
-to clean and format the extracted text.
+to clean and format the extracted text. Transcripts of several videos can be fetched
+in parallel, and raw transcripts are cached on disk.
 """
 
 from youtube_transcript_api import YouTubeTranscriptApi
+import json
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import parse_qs, urlparse
+from podcastfy.utils.cache import DiskCache
 from podcastfy.utils.config import load_config
 
 logger = logging.getLogger(__name__)
 
+VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+# Path prefixes followed by the video ID, e.g. youtube.com/shorts/<id>
+VIDEO_ID_PATH_PREFIXES = ('embed', 'shorts', 'live', 'v', 'e')
+
+
+def get_video_id(url: str) -> str:
+	"""
+	Get the video ID from a YouTube URL.
+
+	Supports watch URLs (including extra query parameters), youtu.be links,
+	embed, shorts and live URLs, and bare video IDs.
+
+	Args:
+		url (str): YouTube video URL or ID.
+
+	Returns:
+		str: The 11-character video ID.
+
+	Raises:
+		ValueError: If no video ID can be found in the URL.
+	"""
+	url = url.strip()
+	if VIDEO_ID_PATTERN.match(url):
+		return url
+	if not url.startswith(('http://', 'https://')):
+		url = 'https://' + url
+
+	parsed = urlparse(url)
+	host = parsed.netloc.lower()
+	path_parts = [part for part in parsed.path.split('/') if part]
+
+	candidate = None
+	if host.endswith('youtu.be'):
+		candidate = path_parts[0] if path_parts else None
+	elif 'v' in parse_qs(parsed.query):
+		candidate = parse_qs(parsed.query)['v'][0]
+	elif len(path_parts) >= 2 and path_parts[0] in VIDEO_ID_PATH_PREFIXES:
+		candidate = path_parts[1]
+
+	if candidate and VIDEO_ID_PATTERN.match(candidate):
+		return candidate
+	raise ValueError(f"Could not find a YouTube video ID in {url}")
+
+
 class YouTubeTranscriber:
 	def __init__(self):
 		self.config = load_config()
 		self.youtube_transcriber_config = self.config.get('youtube_transcriber')
+		self.remove_phrases = {phrase.lower() for phrase in self.youtube_transcriber_config.get('remove_phrases', [])}
+		self.max_workers = self.youtube_transcriber_config.get('max_workers', 4)
+		self.cache = self._setup_cache()
+
+	def _setup_cache(self) -> Optional[DiskCache]:
+		"""Set up the on-disk transcript cache if enabled in the config."""
+		cache_config = self.youtube_transcriber_config.get('cache', {})
+		if not cache_config.get('enabled', False):
+			return None
+		max_size_mb = cache_config.get('max_size_mb')
+		ttl_hours = cache_config.get('ttl_hours')
+		return DiskCache.shared(
+			cache_config.get('directory', './data/cache/youtube'),
+			max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+			ttl_seconds=ttl_hours * 3600 if ttl_hours else None,
+		)
+
+	def fetch_transcript(self, video_id: str) -> List[Dict[str, Any]]:
+		"""
+		Fetch the raw transcript segments of a video, using the cache if enabled.
+
+		Cached transcripts are refetched once they are older than the cache's ttl_hours.
+
+		Args:
+			video_id (str): YouTube video ID.
+
+		Returns:
+			List[Dict[str, Any]]: Transcript segments with 'text', 'start' and 'duration'.
+		"""
+		key = DiskCache.make_key('youtube', video_id)
+		if self.cache is not None:
+			cached = self.cache.get(key)
+			if cached is not None:
+				logger.debug(f"Using cached transcript of {video_id}")
+				return json.loads(cached)
+
+		transcript = YouTubeTranscriptApi.get_transcript(video_id)
+		if self.cache is not None:
+			self.cache.set(key, json.dumps(transcript).encode('utf-8'))
+		return transcript
+
+	def clean_transcript(self, transcript: List[Dict[str, Any]]) -> str:
+		"""
+		Join transcript segments, dropping segments that are a remove phrase such as '[music]' (case-insensitive).
+
+		Args:
+			transcript (List[Dict[str, Any]]): Transcript segments.
+
+		Returns:
+			str: Cleaned transcript text.
+		"""
+		remove_phrases = self.remove_phrases
+		return " ".join([
+			entry['text'] for entry in transcript
+			if entry['text'].lower() not in remove_phrases
+		])
 
 	def extract_transcript(self, url: str) -> str:
 		"""
@@ -28,17 +136,60 @@ class YouTubeTranscriber:
 			str: Cleaned and extracted transcript.
 		"""
 		try:
-			video_id = url.split("v=")[-1]
-			transcript = YouTubeTranscriptApi.get_transcript(video_id)
-			cleaned_transcript = " ".join([
-				entry['text'] for entry in transcript 
-				if entry['text'].lower() not in self.youtube_transcriber_config['remove_phrases']
-			])
-			return cleaned_transcript
+			return self.clean_transcript(self.fetch_transcript(get_video_id(url)))
 		except Exception as e:
 			logger.error(f"Error extracting YouTube transcript: {str(e)}")
 			raise
 
+	def extract_transcripts(
+		self, urls: List[str], max_workers: Optional[int] = None, return_exceptions: bool = False
+	) -> List[Union[str, Exception]]:
+		"""
+		Extract transcripts from several YouTube videos in parallel.
+
+		URLs of the same video are fetched once.
+
+		Args:
+			urls (List[str]): YouTube video URLs.
+			max_workers (Optional[int]): Maximum number of concurrent fetches. Defaults to the config.
+			return_exceptions (bool): Return the error of a failed URL in its place instead of
+				raising it, so other URLs are unaffected. Defaults to False.
+
+		Returns:
+			List[Union[str, Exception]]: Cleaned transcripts (or errors), in the order of urls.
+
+		Raises:
+			Exception: The first error encountered, if any video fails and return_exceptions is False.
+		"""
+		def extract(video_id: str) -> Union[str, Exception]:
+			try:
+				return self.clean_transcript(self.fetch_transcript(video_id))
+			except Exception as e:
+				return e
+
+		video_ids: List[Union[str, Exception]] = []
+		for url in urls:
+			try:
+				video_ids.append(get_video_id(url))
+			except ValueError as e:
+				video_ids.append(e)
+
+		unique_ids = list(dict.fromkeys(video_id for video_id in video_ids if isinstance(video_id, str)))
+		transcripts: Dict[str, Union[str, Exception]] = {}
+		if unique_ids:
+			workers = max(1, min(max_workers or self.max_workers, len(unique_ids)))
+			with ThreadPoolExecutor(max_workers=workers) as executor:
+				transcripts = dict(zip(unique_ids, executor.map(extract, unique_ids)))
+
+		results = [transcripts[video_id] if isinstance(video_id, str) else video_id for video_id in video_ids]
+		errors = [result for result in results if isinstance(result, Exception)]
+		for url, result in zip(urls, results):
+			if isinstance(result, Exception):
+				logger.error(f"Error extracting YouTube transcript of {url}: {str(result)}")
+		if errors and not return_exceptions:
+			raise errors[0]
+		return results
+
 def main(seed: int = 42) -> None:
 	"""
 	Test the YouTubeTranscriber class with a specific URL and save the transcript.
@@ -6,15 +6,17 @@ It supports ElevenLabs, Google, OpenAI and Edge TTS services and handles the con
 including cleaning of input text and merging of audio files.
 """
 
-import io
+import asyncio
 import logging
 import os
 import re
 import tempfile
-from typing import List, Tuple, Optional, Dict, Any
-from pydub import AudioSegment
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 from .tts.factory import TTSProviderFactory
+from .utils.audio import concatenate_audio, concatenate_mp3, extract_mp3_frames
+from .utils.cache import DiskCache
 from .utils.config import load_config
 from .utils.config_conversation import load_conversation_config
 
@@ -55,11 +57,18 @@ class TextToSpeech:
         self._setup_directories()
         self.audio_format = self.tts_config.get("audio_format", "mp3")
         self.ending_message = self.tts_config.get("ending_message", "")
+        self.mp3_frame_concat = self.tts_config.get("mp3_frame_concat", True)
+        self.streaming = self.tts_config.get("streaming", False)
+        self.max_concurrency = self._get_max_concurrency()
+        self.cache = self._setup_cache()
+
+    def _get_provider_name(self) -> str:
+        """Get provider name in lowercase without 'TTS' suffix."""
+        return self.provider.__class__.__name__.lower().replace("tts", "")
 
     def _get_provider_config(self) -> Dict[str, Any]:
         """Get provider-specific configuration."""
-        # Get provider name in lowercase without 'TTS' suffix
-        provider_name = self.provider.__class__.__name__.lower().replace("tts", "")
+        provider_name = self._get_provider_name()
 
         # Get provider config from tts_config
         provider_config = self.tts_config.get(provider_name, {})
@@ -77,6 +86,70 @@ class TextToSpeech:
         logger.debug(f"Using provider config: {provider_config}")
         return provider_config
 
+    def _get_max_concurrency(self) -> int:
+        """
+        Get the number of turns that may be synthesized in parallel.
+
+        The global `max_concurrency` setting is capped by the provider-specific
+        `max_concurrency`, if any, so that per-provider rate limits are honored.
+        """
+        max_concurrency = self.tts_config.get("max_concurrency", 1) or 1
+        provider_limit = self._get_provider_config().get("max_concurrency")
+        if provider_limit:
+            max_concurrency = min(max_concurrency, provider_limit)
+        return max(1, int(max_concurrency))
+
+    def _setup_cache(self) -> Optional[DiskCache]:
+        """Setup the on-disk cache of synthesized turns, if enabled."""
+        cache_config = self.tts_config.get("cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+
+        max_size_mb = cache_config.get("max_size_mb")
+        return DiskCache.shared(
+            cache_config.get("directory", "./data/cache/tts"),
+            max_size_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+        )
+
+    def _cache_key(self, text: str, voice: str, model: str) -> str:
+        """
+        Get the cache key of a turn.
+
+        Cache entries are keyed on provider, model, voice, whitespace-normalized
+        text and audio format, so unchanged turns are never re-synthesized.
+        """
+        return DiskCache.make_key(
+            self._get_provider_name(),
+            model,
+            voice,
+            " ".join(text.split()),
+            self.audio_format,
+        )
+
+    def _synthesize(self, text: str, voice: str, model: str) -> bytes:
+        """Synthesize a single turn, serving it from the cache when possible."""
+        if self.cache is None:
+            return self.provider.generate_audio(text, voice, model)
+
+        key = self._cache_key(text, voice, model)
+        audio_data = self.cache.get(key)
+        if audio_data is None:
+            audio_data = self.provider.generate_audio(text, voice, model)
+            self.cache.set(key, audio_data)
+        return audio_data
+
+    async def _asynthesize(self, text: str, voice: str, model: str) -> bytes:
+        """Asynchronously synthesize a single turn, serving it from the cache when possible."""
+        if self.cache is None:
+            return await self.provider.agenerate_audio(text, voice, model)
+
+        key = self._cache_key(text, voice, model)
+        audio_data = self.cache.get(key)
+        if audio_data is None:
+            audio_data = await self.provider.agenerate_audio(text, voice, model)
+            self.cache.set(key, audio_data)
+        return audio_data
+
     def convert_to_speech(self, text: str, output_file: str) -> None:
         """
         Convert input text to speech and save as an audio file.
@@ -96,26 +169,15 @@ class TextToSpeech:
 
         cleaned_text = text
 
+        if self.streaming:
+            self.stream_to_speech(cleaned_text, output_file)
+            return
+
         try:
             logger.debug(f"Using provider model: {self.provider.model}")
 
-            if (
-                "multi" in self.provider.model.lower()
-            ):  # refactor: We should have instead MultiSpeakerTTS and SingleSpeakerTTS classes
-                provider_config = self._get_provider_config()
-                voice = provider_config.get("default_voices", {}).get("question")
-                voice2 = provider_config.get("default_voices", {}).get("answer")
-                model = provider_config.get("model")
-                logger.debug(f"Provider config: {provider_config}")
-                
-                logger.debug("Generating audio with multi-speaker provider")
-                audio_data_list = self.provider.generate_audio(
-                    cleaned_text,
-                    voice="S",
-                    model="en-US-Studio-MultiSpeaker",
-                    voice2="R",
-                    ending_message=self.ending_message,
-                )
+            if self._is_multi_speaker():
+                audio_data_list = self._generate_multi_speaker_audio(cleaned_text)
 
                 try:
                     # First verify we have data
@@ -123,23 +185,12 @@ class TextToSpeech:
                         raise ValueError("No audio data chunks provided")
 
                     logger.info(f"Starting audio processing with {len(audio_data_list)} chunks")
-                    combined = AudioSegment.empty()
-                    
-                    for i, chunk in enumerate(audio_data_list):
-                        logger.debug(f"Processing chunk {i}, size: {len(chunk)} bytes")
-                        segment = AudioSegment.from_file(io.BytesIO(chunk))
-                        logger.debug(f"Loaded chunk {i}, duration: {len(segment)}ms")
-                        
-                        combined += segment
-                    
-                    # Export with high quality settings
-                    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-                    logger.debug(f"Exporting combined audio to {output_file}")
-                    combined.export(
-                        output_file, 
-                        format=self.audio_format,
+                    # Export with high quality settings if re-encoding is needed
+                    self._write_audio(
+                        audio_data_list,
+                        output_file,
                         codec="libmp3lame",
-                        bitrate="320k"
+                        bitrate="320k",
                     )
                     logger.info(f"Successfully exported audio to {output_file}")
                     
@@ -161,26 +212,240 @@ class TextToSpeech:
             logger.error(f"Error converting text to speech: {str(e)}", exc_info=True)
             raise
 
-    def _generate_audio_segments(self, text: str, temp_dir: str) -> List[str]:
-        """Generate audio segments for each Q&A pair."""
+    async def aconvert_to_speech(self, text: str, output_file: str) -> None:
+        """
+        Asynchronously convert input text to speech and save as an audio file.
+
+        Turns are synthesized with the provider's async API, up to `max_concurrency`
+        at a time, so many episodes can be converted on a single event loop.
+
+        Args:
+                text (str): Input text to convert to speech.
+                output_file (str): Path to save the output audio file.
+        """
+        logger.debug(f"Starting aconvert_to_speech with output file: {output_file}")
+
+        try:
+            if self._is_multi_speaker():
+                audio_data_list = await self.provider.agenerate_audio(
+                    text, **self._get_multi_speaker_params()
+                )
+                if not audio_data_list:
+                    raise ValueError("No audio data chunks provided")
+                export_params = {"codec": "libmp3lame", "bitrate": "320k"}
+            else:
+                audio_data_list = await self._asynthesize_turns(self._get_turns(text))
+                export_params = {"format": self.audio_format}
+
+            # Audio assembly is CPU/IO-bound, keep it off the event loop
+            await asyncio.to_thread(
+                self._write_audio, audio_data_list, output_file, **export_params
+            )
+            logger.info(f"Audio saved to {output_file}")
+
+        except Exception as e:
+            logger.error(f"Error converting text to speech: {str(e)}", exc_info=True)
+            raise
+
+    def stream_to_speech(self, text: str, output: Union[str, BinaryIO]) -> None:
+        """
+        Convert input text to speech, writing each turn's audio as soon as it is ready.
+
+        A turn is appended to the output once it and all earlier turns have been
+        synthesized, so playback can start while later turns are still generated.
+        Multi-speaker providers are streamed chunk by chunk. If streaming to a path
+        fails, the partial file is removed.
+
+        Args:
+                text (str): Input text to convert to speech.
+                output (Union[str, BinaryIO]): Path of the output audio file or a writable binary file-like sink.
+
+        Raises:
+            ValueError: If the audio format is not mp3
+        """
+        if isinstance(output, str):
+            output_dir = os.path.dirname(output)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            try:
+                with open(output, "wb") as f:
+                    self.stream_to_speech(text, f)
+            except Exception:
+                if os.path.exists(output):
+                    os.remove(output)
+                raise
+            logger.info(f"Audio streamed to {output}")
+            return
+
+        try:
+            for audio_data in self.iter_speech(text):
+                output.write(audio_data)
+                if hasattr(output, "flush"):
+                    output.flush()
+        except Exception as e:
+            logger.error(f"Error streaming text to speech: {str(e)}", exc_info=True)
+            raise
+
+    def iter_speech(self, text: str) -> Iterator[bytes]:
+        """
+        Convert input text to speech, yielding MP3 audio in transcript order.
+
+        The yielded chunks are bare MP3 frames, so concatenating them produces a
+        playable MP3 stream. Turns whose format differs from the first turn are
+        re-encoded to match it.
+
+        Args:
+                text (str): Input text to convert to speech.
+
+        Yields:
+            bytes: Encoded audio of the next turn (or chunk, for multi-speaker providers).
+
+        Raises:
+            ValueError: If the audio format is not mp3
+        """
+        if self.audio_format != "mp3":
+            raise ValueError(
+                f"Streaming requires mp3 audio format, got {self.audio_format}"
+            )
+
+        if self._is_multi_speaker():
+            segments = self._iter_multi_speaker_audio(text)
+        else:
+            segments = self._synthesize_turns(self._get_turns(text))
+
+        signature = None
+        for audio_data in segments:
+            signature, frames = extract_mp3_frames(audio_data, signature)
+            yield frames
+
+    def _is_multi_speaker(self) -> bool:
+        """Check whether the provider synthesizes the whole conversation at once."""
+        # refactor: We should have instead MultiSpeakerTTS and SingleSpeakerTTS classes
+        return "multi" in self.provider.model.lower()
+
+    def _generate_multi_speaker_audio(self, text: str) -> List[bytes]:
+        """Generate audio chunks for the whole conversation with a multi-speaker provider."""
+        provider_config = self._get_provider_config()
+        logger.debug(f"Provider config: {provider_config}")
+
+        logger.debug("Generating audio with multi-speaker provider")
+        return self.provider.generate_audio(text, **self._get_multi_speaker_params())
+
+    def _iter_multi_speaker_audio(self, text: str) -> Iterator[bytes]:
+        """Yield audio chunks of the conversation in order as a multi-speaker provider synthesizes them."""
+        if not hasattr(self.provider, "iter_audio"):
+            # Provider can only return the whole conversation at once
+            return iter(self._generate_multi_speaker_audio(text))
+        logger.debug("Streaming audio with multi-speaker provider")
+        return self.provider.iter_audio(text, **self._get_multi_speaker_params())
+
+    def _get_multi_speaker_params(self) -> Dict[str, Any]:
+        """Get the generate_audio parameters for a multi-speaker provider."""
+        return {
+            "voice": "S",
+            "model": "en-US-Studio-MultiSpeaker",
+            "voice2": "R",
+            "ending_message": self.ending_message,
+            "max_workers": self.max_concurrency,
+        }
+
+    def _get_turns(self, text: str) -> List[Tuple[str, str, str]]:
+        """
+        Split the transcript into turns.
+
+        Returns:
+            List[Tuple[str, str, str]]: (name, content, voice) for each turn in order,
+                where name is e.g. "1_question" or "1_answer".
+        """
         qa_pairs = self.provider.split_qa(
             text, self.ending_message, self.provider.get_supported_tags()
         )
-        audio_files = []
-        provider_config = self._get_provider_config()
+        default_voices = self._get_provider_config().get("default_voices", {})
 
+        turns = []
         for idx, (question, answer) in enumerate(qa_pairs, 1):
             for speaker_type, content in [("question", question), ("answer", answer)]:
-                temp_file = os.path.join(
-                    temp_dir, f"{idx}_{speaker_type}.{self.audio_format}"
+                turns.append(
+                    (f"{idx}_{speaker_type}", content, default_voices.get(speaker_type))
                 )
-                voice = provider_config.get("default_voices", {}).get(speaker_type)
-                model = provider_config.get("model")
+        return turns
 
-                audio_data = self.provider.generate_audio(content, voice, model)
-                with open(temp_file, "wb") as f:
-                    f.write(audio_data)
-                audio_files.append(temp_file)
+    def _synthesize_turns(self, turns: List[Tuple[str, str, str]]) -> Iterator[bytes]:
+        """
+        Synthesize turns, yielding their audio data in order.
+
+        Turns are synthesized concurrently, up to `max_concurrency` at a time, and
+        each is yielded as soon as it and all earlier turns are ready.
+        """
+        model = self._get_provider_config().get("model")
+
+        if self.max_concurrency == 1 or len(turns) <= 1:
+            for _, content, voice in turns:
+                yield self._synthesize(content, voice, model)
+        else:
+            logger.debug(
+                f"Synthesizing {len(turns)} turns with max_concurrency={self.max_concurrency}"
+            )
+            executor = ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(turns))
+            )
+            try:
+                futures = [
+                    executor.submit(self._synthesize, content, voice, model)
+                    for _, content, voice in turns
+                ]
+                # Yield in submission order so questions still precede answers
+                for future in futures:
+                    yield future.result()
+            finally:
+                # Don't keep synthesizing (and paying for) turns after a failure
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        if self.cache is not None:
+            logger.info(f"TTS cache stats: {self.cache.stats}")
+
+    async def _asynthesize_turns(self, turns: List[Tuple[str, str, str]]) -> List[bytes]:
+        """
+        Asynchronously synthesize turns, up to `max_concurrency` at a time.
+
+        Returns:
+            List[bytes]: Audio data of each turn, in the same order as turns.
+        """
+        model = self._get_provider_config().get("model")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def synthesize(content: str, voice: str) -> bytes:
+            async with semaphore:
+                return await self._asynthesize(content, voice, model)
+
+        # A task group cancels the remaining turns if any of them fails
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [
+                    task_group.create_task(synthesize(content, voice))
+                    for _, content, voice in turns
+                ]
+        except ExceptionGroup as e:
+            # Surface the first failure, as the synchronous path does
+            raise e.exceptions[0]
+
+        if self.cache is not None:
+            logger.info(f"TTS cache stats: {self.cache.stats}")
+        return [task.result() for task in tasks]
+
+    def _generate_audio_segments(self, text: str, temp_dir: str) -> List[str]:
+        """
+        Generate audio segments for each Q&A pair.
+
+        The returned file paths keep the question/answer order of the transcript.
+        """
+        turns = self._get_turns(text)
+        audio_files = []
+        for audio_data, (name, _, _) in zip(self._synthesize_turns(turns), turns):
+            temp_file = os.path.join(temp_dir, f"{name}.{self.audio_format}")
+            with open(temp_file, "wb") as f:
+                f.write(audio_data)
+            audio_files.append(temp_file)
 
         return audio_files
 
@@ -211,24 +476,49 @@ class TextToSpeech:
             # Sort files by index and type (question/answer)
             audio_files.sort(key=get_sort_key)
 
-            # Create empty audio segment
-            combined = AudioSegment.empty()
-
-            # Add each audio file to the combined segment
-            for file_path in audio_files:
-                combined += AudioSegment.from_file(file_path, format=self.audio_format)
-
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-
-            # Export the combined audio
-            combined.export(output_file, format=self.audio_format)
+            self._write_audio(audio_files, output_file, format=self.audio_format)
             logger.info(f"Merged audio saved to {output_file}")
 
         except Exception as e:
             logger.error(f"Error merging audio files: {str(e)}")
             raise
 
+    def _write_audio(
+        self,
+        segments: List[Union[str, bytes]],
+        output_file: str,
+        format: Optional[str] = None,
+        **export_params: Any,
+    ) -> None:
+        """
+        Concatenate audio segments and save them to output_file.
+
+        MP3 segments sharing the same format are joined frame by frame without
+        decoding. Otherwise segments are decoded and re-encoded once.
+
+        Args:
+                segments: Audio file paths or encoded audio data, in playback order
+                output_file: Path to save the combined audio file
+                format: Audio format of the segments. Detected by ffmpeg if None
+                **export_params: Extra parameters for AudioSegment.export when re-encoding
+        """
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+        if self.audio_format == "mp3" and self.mp3_frame_concat:
+            audio_data = concatenate_mp3(segments)
+            if audio_data is not None:
+                with open(output_file, "wb") as f:
+                    f.write(audio_data)
+                logger.debug("Joined MP3 frames without re-encoding")
+                return
+            logger.debug("Segments are not frame-compatible MP3, re-encoding")
+
+        # Decode each segment once into a single buffer
+        combined = concatenate_audio(segments, format=format)
+        logger.debug(f"Combined audio duration: {len(combined)}ms")
+        combined.export(output_file, format=self.audio_format, **export_params)
+
     def _setup_directories(self) -> None:
         """Setup required directories for audio processing."""
         self.output_directories = self.tts_config.get("output_directories", {})
@@ -1,8 +1,10 @@
 """Abstract base class for Text-to-Speech providers."""
 
 from abc import ABC, abstractmethod
-from typing import List, ClassVar, Tuple
+from typing import Any, Callable, List, ClassVar, Tuple
+import asyncio
 import re
+import weakref
 
 class TTSProvider(ABC):
     """Abstract base class that defines the interface for TTS providers."""
@@ -31,6 +33,44 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def agenerate_audio(self, text: str, voice: str, model: str, **kwargs: Any) -> bytes:
+        """
+        Asynchronously generate audio from text using the provider's API.
+        
+        Runs generate_audio in a worker thread by default. Providers with a
+        native async client override this to avoid tying up a thread per request.
+        
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID/name to use
+            model: Model ID/name to use
+            **kwargs: Additional provider-specific parameters for generate_audio
+            
+        Returns:
+            Audio data as bytes
+        """
+        return await asyncio.to_thread(self.generate_audio, text, voice, model, **kwargs)
+
+    def get_async_client(self, create_client: Callable[[], Any]) -> Any:
+        """
+        Get the provider's async client for the running event loop.
+        
+        Async HTTP/gRPC clients are bound to the event loop they were created in,
+        while providers are shared across episodes (and event loops) by
+        TTSProviderFactory, so one client is kept per loop.
+        
+        Args:
+            create_client: Builds a new async client
+            
+        Returns:
+            The async client for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        clients = self.__dict__.setdefault('_async_clients', weakref.WeakKeyDictionary())
+        if loop not in clients:
+            clients[loop] = create_client()
+        return clients[loop]
+
     def get_supported_tags(self) -> List[str]:
         """
         Get set of SSML tags supported by this provider.
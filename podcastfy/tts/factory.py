@@ -1,6 +1,9 @@
 """Factory for creating TTS providers."""
 
-from typing import Dict, Type, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Type, Optional
 from .base import TTSProvider
 from .providers.elevenlabs import ElevenLabsTTS
 from .providers.openai import OpenAITTS
@@ -18,15 +21,28 @@ class TTSProviderFactory:
         'geminimulti': GeminiMultiTTS
     }
     
+    # Provider instances shared process-wide, so clients keep their connections warm across episodes.
+    # The pool is bounded, so a multi-tenant server doesn't keep a client (and API key) of every
+    # tenant alive; the least recently used instance is dropped beyond max_pool_size.
+    _pool: "OrderedDict[Tuple[str, Optional[str], Optional[str]], TTSProvider]" = OrderedDict()
+    _pool_lock = threading.Lock()
+    max_pool_size = 8
+    
     @classmethod
-    def create(cls, provider_name: str, api_key: Optional[str] = None, model: Optional[str] = None) -> TTSProvider:
+    def create(cls, provider_name: str, api_key: Optional[str] = None, model: Optional[str] = None,
+               pooled: bool = True) -> TTSProvider:
         """
         Create a TTS provider instance.
         
+        Providers are pooled by default: the same instance, with its HTTP/gRPC
+        clients, is returned for every call with the same provider, model and API key,
+        as long as it is among the max_pool_size most recently used instances.
+        
         Args:
             provider_name: Name of the provider to create
             api_key: Optional API key for the provider
             model: Optional model name for the provider
+            pooled: Reuse a pooled instance instead of creating a new one
             
         Returns:
             TTSProvider instance
@@ -38,10 +54,40 @@ class TTSProviderFactory:
         if not provider_class:
             raise ValueError(f"Unsupported provider: {provider_name}. "
                            f"Choose from: {', '.join(cls._providers.keys())}")
-                           
+        
+        if not pooled:
+            return cls._instantiate(provider_class, api_key, model)
+        
+        # Key on a digest so the pool's keys don't hold API keys in plain text
+        key_digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+        key = (provider_name.lower(), model, key_digest)
+        with cls._pool_lock:
+            provider = cls._pool.get(key)
+            if provider is None:
+                provider = cls._instantiate(provider_class, api_key, model)
+                cls._pool[key] = provider
+                while len(cls._pool) > cls.max_pool_size:
+                    cls._pool.popitem(last=False)
+            else:
+                cls._pool.move_to_end(key)
+        return provider
+    
+    @staticmethod
+    def _instantiate(provider_class: Type[TTSProvider], api_key: Optional[str], model: Optional[str]) -> TTSProvider:
+        """Create a new provider instance."""
         return provider_class(api_key, model) if api_key else provider_class(model=model)
     
+    @classmethod
+    def clear_pool(cls) -> None:
+        """Drop all pooled provider instances."""
+        with cls._pool_lock:
+            cls._pool.clear()
+    
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[TTSProvider]) -> None:
         """Register a new provider class."""
-        cls._providers[name.lower()] = provider_class 
\ No newline at end of file
+        cls._providers[name.lower()] = provider_class
+        # Pooled instances of a replaced provider class must not be reused
+        with cls._pool_lock:
+            for key in [key for key in cls._pool if key[0] == name.lower()]:
+                del cls._pool[key] 
\ No newline at end of file
@@ -1,9 +1,7 @@
 """Edge TTS provider implementation."""
 
 import edge_tts
-import os
-import tempfile
-from typing import List
+from typing import AsyncIterator, List
 from ..base import TTSProvider
 
 class EdgeTTS(TTSProvider):
@@ -22,29 +20,36 @@ class EdgeTTS(TTSProvider):
         import nest_asyncio
         import asyncio
         
-        # Apply nest_asyncio to allow nested event loops
-        nest_asyncio.apply()
-        
-        async def _generate():
-            communicate = edge_tts.Communicate(text, voice)
-            # Create a temporary file with proper context management
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
-                temp_path = tmp_file.name
-                
-            try:
-                # Save audio to temporary file
-                await communicate.save(temp_path)
-                # Read the audio data
-                with open(temp_path, 'rb') as f:
-                    return f.read()
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop is running in this thread, e.g. a concurrent synthesis worker.
+            # asyncio.run closes its loop when done, so workers don't leak loops.
+            return asyncio.run(self.agenerate_audio(text, voice, model))
+
+        # Use nest_asyncio to handle nested event loops, e.g. in notebooks
+        nest_asyncio.apply(loop)
+        return loop.run_until_complete(self.agenerate_audio(text, voice, model))
 
-        # Use nest_asyncio to handle nested event loops
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(_generate())
+    async def agenerate_audio(self, text: str, voice: str, model: str, voice2: str = None) -> bytes:
+        """Generate audio using Edge TTS without blocking the event loop."""
+        return b''.join([chunk async for chunk in self.astream_audio(text, voice)])
+
+    async def astream_audio(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        """
+        Stream audio from Edge TTS.
+        
+        Args:
+            text (str): Text to convert to speech
+            voice (str): Voice name to use
+            
+        Yields:
+            bytes: MP3 audio chunks as they are received
+        """
+        communicate = edge_tts.Communicate(text, voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
         
     def get_supported_tags(self) -> List[str]:
         """Get supported SSML tags."""
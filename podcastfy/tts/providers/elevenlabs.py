@@ -13,6 +13,7 @@ class ElevenLabsTTS(TTSProvider):
             api_key (str): ElevenLabs API key
             model (str): Model name to use. Defaults to "eleven_multilingual_v2"
         """
+        self.api_key = api_key
         self.client = elevenlabs_client.ElevenLabs(api_key=api_key)
         self.model = model
         
@@ -24,6 +25,18 @@ class ElevenLabsTTS(TTSProvider):
             model=model
         )
         return b''.join(chunk for chunk in audio if chunk)
+
+    async def agenerate_audio(self, text: str, voice: str, model: str, voice2: str = None) -> bytes:
+        """Generate audio using the async ElevenLabs API."""
+        async_client = self.get_async_client(
+            lambda: elevenlabs_client.AsyncElevenLabs(api_key=self.api_key)
+        )
+        audio = await async_client.generate(
+            text=text,
+            voice=voice,
+            model=model
+        )
+        return b''.join([chunk async for chunk in audio if chunk])
         
     def get_supported_tags(self) -> List[str]:
         """Get supported SSML tags."""
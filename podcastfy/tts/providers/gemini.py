@@ -19,9 +19,10 @@ class GeminiTTS(TTSProvider):
             model (str): Default voice model to use
         """
         self.model = model
+        self.client_options = {'api_key': api_key} if api_key else None
         try:
             self.client = texttospeech_v1beta1.TextToSpeechClient(
-                client_options={'api_key': api_key} if api_key else None
+                client_options=self.client_options
             )
         except Exception as e:
             logger.error(f"Failed to initialize Google TTS client: {str(e)}")
@@ -47,29 +48,28 @@ class GeminiTTS(TTSProvider):
         self.validate_parameters(text, voice, model or self.model)
         
         try:
-            # Create synthesis input
-            synthesis_input = texttospeech_v1beta1.SynthesisInput(
-                text=text
+            # Generate speech
+            response = self.client.synthesize_speech(
+                **self._build_request(text, voice)
             )
             
-            # Parse language code from voice ID (e.g., "en-IN" from "en-IN-Journey-D")
-            language_code = "-".join(voice.split("-")[:2])
-
-            voice_params = texttospeech_v1beta1.VoiceSelectionParams(
-                language_code=language_code,
-                name=voice,
-            )
+            return response.audio_content
             
-            # Set audio config
-            audio_config = texttospeech_v1beta1.AudioConfig(
-                audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
+        except Exception as e:
+            logger.error(f"Failed to generate audio: {str(e)}")
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
+    async def agenerate_audio(self, text: str, voice: str = "en-US-Journey-F",
+                              model: str = None, **kwargs) -> bytes:
+        """Generate audio using the async Google Cloud TTS API."""
+        self.validate_parameters(text, voice, model or self.model)
+        
+        try:
+            async_client = self.get_async_client(
+                lambda: texttospeech_v1beta1.TextToSpeechAsyncClient(client_options=self.client_options)
             )
-            
-            # Generate speech
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice_params,
-                audio_config=audio_config
+            response = await async_client.synthesize_speech(
+                **self._build_request(text, voice)
             )
             
             return response.audio_content
@@ -77,6 +77,32 @@ class GeminiTTS(TTSProvider):
         except Exception as e:
             logger.error(f"Failed to generate audio: {str(e)}")
             raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
+    def _build_request(self, text: str, voice: str) -> dict:
+        """Build the synthesize_speech request for the given text and voice."""
+        # Create synthesis input
+        synthesis_input = texttospeech_v1beta1.SynthesisInput(
+            text=text
+        )
+        
+        # Parse language code from voice ID (e.g., "en-IN" from "en-IN-Journey-D")
+        language_code = "-".join(voice.split("-")[:2])
+
+        voice_params = texttospeech_v1beta1.VoiceSelectionParams(
+            language_code=language_code,
+            name=voice,
+        )
+        
+        # Set audio config
+        audio_config = texttospeech_v1beta1.AudioConfig(
+            audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3
+        )
+        
+        return {
+            "input": synthesis_input,
+            "voice": voice_params,
+            "audio_config": audio_config,
+        }
     
     def get_supported_tags(self) -> List[str]:
         """Get supported SSML tags."""
@@ -1,18 +1,32 @@
 """Google Cloud Text-to-Speech provider implementation."""
 
+from google.api_core import exceptions as google_exceptions
 from google.cloud import texttospeech_v1beta1
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List
 from ..base import TTSProvider
+from ...utils.audio import concatenate_audio, concatenate_mp3, load_segment
+import random
 import re
+import time
 import logging
 from io import BytesIO
-from pydub import AudioSegment
 
 logger = logging.getLogger(__name__)
 
+# Quota and availability errors that are worth retrying
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+)
+
 class GeminiMultiTTS(TTSProvider):
     """Google Cloud Text-to-Speech provider with multi-speaker support."""
     
+    max_retries = 5
+    initial_backoff = 1.0  # seconds
+    
     def __init__(self, api_key: str = None, model: str = "en-US-Studio-MultiSpeaker"):
         """
         Initialize Google Cloud TTS provider.
@@ -147,52 +161,37 @@ class GeminiMultiTTS(TTSProvider):
         if len(audio_chunks) == 1:
             return audio_chunks[0]
         
+        # Join the MP3 frames directly when all chunks share the same format
+        merged = concatenate_mp3([chunk for chunk in audio_chunks if chunk])
+        if merged is not None:
+            return merged
+        logger.debug("Audio chunks are not frame-compatible MP3, re-encoding")
+        
         try:
-            # Initialize combined audio with first chunk
-            combined = None
             valid_chunks = []
             
             for i, chunk in enumerate(audio_chunks):
+                # Ensure chunk is not empty
+                if not chunk or len(chunk) == 0:
+                    logger.warning(f"Skipping empty chunk {i}")
+                    continue
+                
+                # Decode from memory so concurrent merges never share files
                 try:
-                    # Ensure chunk is not empty
-                    if not chunk or len(chunk) == 0:
-                        logger.warning(f"Skipping empty chunk {i}")
-                        continue
-                    
-                    # Save chunk to temporary file for ffmpeg to process
-                    temp_file = f"temp_chunk_{i}.mp3"
-                    with open(temp_file, "wb") as f:
-                        f.write(chunk)
-                    
-                    # Create audio segment from temp file
-                    try:
-                        segment = AudioSegment.from_file(temp_file, format="mp3")
-                        if len(segment) > 0:
-                            valid_chunks.append(segment)
-                            logger.debug(f"Successfully processed chunk {i}")
-                        else:
-                            logger.warning(f"Zero-length segment in chunk {i}")
-                    except Exception as e:
-                        logger.error(f"Error processing chunk {i}: {str(e)}")
-                    
-                    # Clean up temp file
-                    import os
-                    try:
-                        os.remove(temp_file)
-                    except Exception as e:
-                        logger.warning(f"Failed to remove temp file {temp_file}: {str(e)}")
-                    
+                    segment = load_segment(chunk, format="mp3")
+                    if len(segment) > 0:
+                        valid_chunks.append(segment)
+                        logger.debug(f"Successfully processed chunk {i}")
+                    else:
+                        logger.warning(f"Zero-length segment in chunk {i}")
                 except Exception as e:
-                    logger.error(f"Error handling chunk {i}: {str(e)}")
-                    continue
+                    logger.error(f"Error processing chunk {i}: {str(e)}")
             
             if not valid_chunks:
                 raise RuntimeError("No valid audio chunks to merge")
             
             # Merge valid chunks
-            combined = valid_chunks[0]
-            for segment in valid_chunks[1:]:
-                combined = combined + segment
+            combined = concatenate_audio(valid_chunks)
             
             # Export with specific parameters
             output = BytesIO()
@@ -217,100 +216,138 @@ class GeminiMultiTTS(TTSProvider):
             raise RuntimeError(f"Failed to merge audio chunks and no valid fallback found: {str(e)}")
 
     def generate_audio(self, text: str, voice: str = "R", model: str = "en-US-Studio-MultiSpeaker", 
-                       voice2: str = "S", ending_message: str = ""):
+                       voice2: str = "S", ending_message: str = "", max_workers: int = 1):
         """
         Generate audio using Google Cloud TTS API with multi-speaker support.
         Handles text longer than 5000 bytes by chunking and merging.
+        Chunks are synthesized concurrently, up to max_workers at a time, and
+        returned in transcript order.
+        """
+        try:
+            return list(self.iter_audio(text, voice, model, voice2, ending_message, max_workers))
+        except Exception as e:
+            logger.error(f"Failed to generate audio: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
+    def iter_audio(self, text: str, voice: str = "R", model: str = "en-US-Studio-MultiSpeaker",
+                   voice2: str = "S", ending_message: str = "", max_workers: int = 1) -> Iterator[bytes]:
+        """
+        Generate audio chunk by chunk, yielding each chunk's MP3 data in transcript order.
+
+        Chunks are synthesized concurrently, up to max_workers at a time, and each is
+        yielded as soon as it and all earlier chunks are ready.
         """
         logger.info(f"Starting audio generation for text of length: {len(text)}")
-        logger.debug(f"Parameters: voice={voice}, voice2={voice2}, model={model}")
-        #print("######################### TEXT #########################")
-        #print(text)
-        #print("######################### END TEXT #########################")
+        logger.debug(f"Parameters: voice={voice}, voice2={voice2}, model={model}, max_workers={max_workers}")
+        # Split text into chunks if needed
+        text_chunks = self.chunk_text(text)
+        logger.info(f"Text split into {len(text_chunks)} chunks")
+        synthesis_inputs = [
+            self._build_synthesis_input(chunk, voice, voice2) for chunk in text_chunks
+        ]
+        
+        # Set voice parameters
+        voice_params = texttospeech_v1beta1.VoiceSelectionParams(
+            language_code="en-US",
+            name=model
+        )
+        
+        # Set audio config
+        audio_config = texttospeech_v1beta1.AudioConfig(
+            audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3,
+            #sample_rate_hertz=44100,  # Specify sample rate
+            #effects_profile_id=['headphone-class-device'],  # Optimize for headphones
+            #speaking_rate=1.0,  # Normal speaking rate
+        )
+        
+        def synthesize(synthesis_input):
+            return self._synthesize_chunk(synthesis_input, voice_params, audio_config)
+        
+        workers = max(1, min(max_workers or 1, len(synthesis_inputs)))
+        executor = ThreadPoolExecutor(max_workers=workers)
         try:
-            # Split text into chunks if needed
-            text_chunks = self.chunk_text(text)
-            logger.info(f"#########################33 Text split into {len(text_chunks)} chunks")
-            audio_chunks = []
-            #print(text_chunks[0])
+            futures = [executor.submit(synthesize, synthesis_input) for synthesis_input in synthesis_inputs]
+            # Yield in submission order so chunks stay in transcript order
+            for future in futures:
+                yield future.result()
+        finally:
+            # Don't keep synthesizing chunks after a failure or once the consumer stops
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _build_synthesis_input(self, chunk: str, voice: str, voice2: str) -> texttospeech_v1beta1.SynthesisInput:
+        """
+        Build the multi-speaker synthesis input for a text chunk.
+        
+        Args:
+            chunk (str): Text chunk with Person1/Person2 tags
+            voice (str): Speaker for Person1 turns
+            voice2 (str): Speaker for Person2 turns
             
-            # Process each chunk
-            for i, chunk in enumerate(text_chunks, 1):
-                logger.debug(f"Processing chunk {i}/{len(text_chunks)}")
-                # Create multi-speaker markup
-                multi_speaker_markup = texttospeech_v1beta1.MultiSpeakerMarkup()
-                #print("######################### CHUNK #########################")
-                #print(chunk)
-                # Get Q&A pairs for this chunk
-                qa_pairs = self.split_qa(chunk, "", self.get_supported_tags())
-                logger.debug(f"Found {len(qa_pairs)} Q&A pairs in chunk {i}")
-                #print("######################### QA PAIRS #########################")
-                #print(qa_pairs)
-                # Add turns for each Q&A pair
-                for j, (question, answer) in enumerate(qa_pairs, 1):
-                    logger.debug(f"Processing Q&A pair {j}/{len(qa_pairs)}")
-                    
-                    # Split question into smaller chunks if needed
-                    question_chunks = self.split_turn_text(question.strip())
-                    logger.debug(f"Question split into {len(question_chunks)} chunks")
-                    logger.debug(f"######################### Question chunks: {question_chunks}")
-                    for q_chunk in question_chunks:
-                        logger.debug(f"Adding question turn: '{q_chunk[:50]}...' (length: {len(q_chunk)})")
-                        q_turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
-                        q_turn.text = q_chunk
-                        q_turn.speaker = voice
-                        multi_speaker_markup.turns.append(q_turn)
-                    
-                    # Split answer into smaller chunks if needed
-                    if answer:
-                        answer_chunks = self.split_turn_text(answer.strip())
-                        logger.debug(f"Answer split into {len(answer_chunks)} chunks")
-                        logger.debug(f"######################### Answer chunks: {answer_chunks}")
-                        for a_chunk in answer_chunks:
-                            logger.debug(f"Adding answer turn: '{a_chunk[:50]}...' (length: {len(a_chunk)})")
-                            a_turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
-                            a_turn.text = a_chunk
-                            a_turn.speaker = voice2
-                            multi_speaker_markup.turns.append(a_turn)
-                
-                logger.debug(f"Created markup with {len(multi_speaker_markup.turns)} turns")
-                
-                # Create synthesis input with multi-speaker markup
-                synthesis_input = texttospeech_v1beta1.SynthesisInput(
-                    multi_speaker_markup=multi_speaker_markup
-                )
-                
+        Returns:
+            texttospeech_v1beta1.SynthesisInput: Synthesis input with one turn per text piece
+        """
+        # Create multi-speaker markup
+        multi_speaker_markup = texttospeech_v1beta1.MultiSpeakerMarkup()
+        # Get Q&A pairs for this chunk
+        qa_pairs = self.split_qa(chunk, "", self.get_supported_tags())
+        logger.debug(f"Found {len(qa_pairs)} Q&A pairs in chunk")
+        # Add turns for each Q&A pair
+        for j, (question, answer) in enumerate(qa_pairs, 1):
+            logger.debug(f"Processing Q&A pair {j}/{len(qa_pairs)}")
+            
+            # Split question into smaller chunks if needed
+            question_chunks = self.split_turn_text(question.strip())
+            logger.debug(f"Question split into {len(question_chunks)} chunks")
+            for q_chunk in question_chunks:
+                logger.debug(f"Adding question turn: '{q_chunk[:50]}...' (length: {len(q_chunk)})")
+                q_turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
+                q_turn.text = q_chunk
+                q_turn.speaker = voice
+                multi_speaker_markup.turns.append(q_turn)
+            
+            # Split answer into smaller chunks if needed
+            if answer:
+                answer_chunks = self.split_turn_text(answer.strip())
+                logger.debug(f"Answer split into {len(answer_chunks)} chunks")
+                for a_chunk in answer_chunks:
+                    logger.debug(f"Adding answer turn: '{a_chunk[:50]}...' (length: {len(a_chunk)})")
+                    a_turn = texttospeech_v1beta1.MultiSpeakerMarkup.Turn()
+                    a_turn.text = a_chunk
+                    a_turn.speaker = voice2
+                    multi_speaker_markup.turns.append(a_turn)
+        
+        logger.debug(f"Created markup with {len(multi_speaker_markup.turns)} turns")
+        
+        # Create synthesis input with multi-speaker markup
+        return texttospeech_v1beta1.SynthesisInput(
+            multi_speaker_markup=multi_speaker_markup
+        )
+    
+    def _synthesize_chunk(self, synthesis_input: texttospeech_v1beta1.SynthesisInput,
+                          voice_params: texttospeech_v1beta1.VoiceSelectionParams,
+                          audio_config: texttospeech_v1beta1.AudioConfig) -> bytes:
+        """
+        Synthesize a single chunk, retrying with exponential backoff on quota and availability errors.
+        
+        Returns:
+            bytes: MP3 audio data for the chunk
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
                 logger.debug("Calling synthesize_speech API")
-                # Set voice parameters
-                voice_params = texttospeech_v1beta1.VoiceSelectionParams(
-                    language_code="en-US",
-                    name=model
-                )
-                
-                # Set audio config
-                audio_config = texttospeech_v1beta1.AudioConfig(
-                    audio_encoding=texttospeech_v1beta1.AudioEncoding.MP3,
-                    #sample_rate_hertz=44100,  # Specify sample rate
-                    #effects_profile_id=['headphone-class-device'],  # Optimize for headphones
-                    #speaking_rate=1.0,  # Normal speaking rate
-                )
-                
-                # Generate speech for this chunk
                 response = self.client.synthesize_speech(
                     input=synthesis_input,
                     voice=voice_params,
                     audio_config=audio_config
                 )
-
-                audio_chunks.append(response.audio_content)
-            #print(f"#### Audio chunks: {audio_chunks}")
-            #print(f"#### Audio chunks length: {len(audio_chunks)}")
-            return audio_chunks
-        
-            
-        except Exception as e:
-            logger.error(f"Failed to generate audio: {str(e)}", exc_info=True)
-            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+                return response.audio_content
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                # Jitter keeps parallel workers from retrying in lockstep
+                delay = self.initial_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(f"synthesize_speech failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
     
     def get_supported_tags(self) -> List[str]:
         """Get supported SSML tags."""
@@ -1,5 +1,6 @@
 """OpenAI TTS provider implementation."""
 
+import os
 import openai
 from typing import List, Optional, Tuple
 from ..base import TTSProvider
@@ -18,11 +19,13 @@ class OpenAITTS(TTSProvider):
             api_key: OpenAI API key. If None, expects OPENAI_API_KEY env variable
             model: Model name to use. Defaults to "tts-1-hd"
         """
-        if api_key:
-            openai.api_key = api_key
-        elif not openai.api_key:
+        self.api_key = api_key or openai.api_key or os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
             raise ValueError("OpenAI API key must be provided or set in environment")
         self.model = model
+        # Use a client per provider instead of the module-level key, so providers
+        # with different keys can coexist in one process
+        self.client = openai.OpenAI(api_key=self.api_key)
             
     def get_supported_tags(self) -> List[str]:
         """Get all supported SSML tags including provider-specific ones."""
@@ -33,7 +36,22 @@ class OpenAITTS(TTSProvider):
         self.validate_parameters(text, voice, model)
         
         try:
-            response = openai.audio.speech.create(
+            response = self.client.audio.speech.create(
+                model=model,
+                voice=voice,
+                input=text
+            )
+            return response.content
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate audio: {str(e)}") from e
+
+    async def agenerate_audio(self, text: str, voice: str, model: str, voice2: str = None) -> bytes:
+        """Generate audio using the async OpenAI API."""
+        self.validate_parameters(text, voice, model)
+        
+        try:
+            async_client = self.get_async_client(lambda: openai.AsyncOpenAI(api_key=self.api_key))
+            response = await async_client.audio.speech.create(
                 model=model,
                 voice=voice,
                 input=text
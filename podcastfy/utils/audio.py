@@ -0,0 +1,269 @@
+"""
+Audio Utilities Module
+
+This module provides helpers to assemble episode audio from many segments.
+Segments are decoded once and appended to a single PCM buffer, so assembly
+is linear in the number of segments instead of copying the growing episode
+on every concatenation. When all segments are MP3 streams with the same
+format, their frames can be joined directly without decoding at all.
+"""
+
+import io
+import logging
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+from pydub import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+AudioSource = Union[str, bytes, BinaryIO, AudioSegment]
+
+
+def load_segment(source: AudioSource, format: Optional[str] = None) -> AudioSegment:
+	"""
+	Decode an audio source into an AudioSegment.
+
+	Args:
+		source (AudioSource): File path, encoded audio bytes, file-like object or AudioSegment.
+		format (Optional[str]): Audio format of the source. Detected by ffmpeg if None.
+
+	Returns:
+		AudioSegment: The decoded audio.
+	"""
+	if isinstance(source, AudioSegment):
+		return source
+	if isinstance(source, (bytes, bytearray)):
+		source = io.BytesIO(source)
+	return AudioSegment.from_file(source, format=format)
+
+
+def concatenate_audio(sources: Iterable[AudioSource], format: Optional[str] = None) -> AudioSegment:
+	"""
+	Concatenate audio sources into a single AudioSegment in linear time.
+
+	Each source is decoded once and its PCM data appended to one buffer. Segments
+	are converted to a common sample width, frame rate and channel count, using the
+	highest of each, which matches what AudioSegment addition produces.
+
+	Args:
+		sources (Iterable[AudioSource]): Audio sources in playback order.
+		format (Optional[str]): Audio format of the sources. Detected by ffmpeg if None.
+
+	Returns:
+		AudioSegment: The concatenated audio, or an empty segment if there are no sources.
+	"""
+	buffer = bytearray()
+	sample_width = frame_rate = channels = None
+
+	for i, source in enumerate(sources):
+		segment = load_segment(source, format)
+		logger.debug(f"Decoded segment {i}, duration: {len(segment)}ms")
+
+		if sample_width is None:
+			sample_width, frame_rate, channels = segment.sample_width, segment.frame_rate, segment.channels
+		elif (segment.sample_width, segment.frame_rate, segment.channels) != (sample_width, frame_rate, channels):
+			new_params = (
+				max(sample_width, segment.sample_width),
+				max(frame_rate, segment.frame_rate),
+				max(channels, segment.channels),
+			)
+			if new_params != (sample_width, frame_rate, channels):
+				# Rare: a later segment has a higher quality, so upconvert what we have so far
+				buffer = bytearray(
+					_convert(
+						AudioSegment(data=bytes(buffer), sample_width=sample_width, frame_rate=frame_rate, channels=channels),
+						*new_params,
+					).raw_data
+				)
+				sample_width, frame_rate, channels = new_params
+			segment = _convert(segment, sample_width, frame_rate, channels)
+
+		buffer += segment.raw_data
+
+	if sample_width is None:
+		return AudioSegment.empty()
+
+	return AudioSegment(data=buffer, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+
+
+def _convert(segment: AudioSegment, sample_width: int, frame_rate: int, channels: int) -> AudioSegment:
+	"""Convert a segment to the given sample width, frame rate and channel count."""
+	# Same conversion order as AudioSegment addition
+	return segment.set_channels(channels).set_frame_rate(frame_rate).set_sample_width(sample_width)
+
+
+# MPEG audio version ids (header bits 19-20) for the versions we support
+MPEG_2_5, MPEG_2, MPEG_1 = 0, 2, 3
+
+MP3_BITRATES = {
+	MPEG_1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+	MPEG_2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+	MPEG_2_5: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+MP3_SAMPLE_RATES = {
+	MPEG_1: [44100, 48000, 32000],
+	MPEG_2: [22050, 24000, 16000],
+	MPEG_2_5: [11025, 12000, 8000],
+}
+
+
+def parse_mp3_header(data: bytes, offset: int) -> Optional[Tuple[Tuple[int, int, int], int, bool]]:
+	"""
+	Parse an MPEG-1/2/2.5 Layer III frame header.
+
+	Args:
+		data (bytes): MP3 data.
+		offset (int): Offset of the candidate frame header.
+
+	Returns:
+		Optional[Tuple[Tuple[int, int, int], int, bool]]: The frame's (version, sample rate, channels),
+			its length in bytes and whether a 16-bit CRC follows the header, or None if there
+			is no valid frame header at offset.
+	"""
+	if offset + 4 > len(data):
+		return None
+	b0, b1, b2, b3 = data[offset], data[offset + 1], data[offset + 2], data[offset + 3]
+	if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+		return None
+
+	version = (b1 >> 3) & 0x3
+	layer = (b1 >> 1) & 0x3
+	bitrate_index = b2 >> 4
+	sample_rate_index = (b2 >> 2) & 0x3
+	if version not in MP3_BITRATES or layer != 1:
+		return None
+	if bitrate_index in (0, 15) or sample_rate_index == 3:
+		return None
+
+	bitrate = MP3_BITRATES[version][bitrate_index] * 1000
+	sample_rate = MP3_SAMPLE_RATES[version][sample_rate_index]
+	padding = (b2 >> 1) & 0x1
+	# The protection bit is cleared when the header is followed by a CRC
+	has_crc = (b1 & 0x1) == 0
+	channels = 1 if (b3 >> 6) == 3 else 2
+	samples_per_frame = 1152 if version == MPEG_1 else 576
+
+	frame_length = samples_per_frame // 8 * bitrate // sample_rate + padding
+	return (version, sample_rate, channels), frame_length, has_crc
+
+
+def find_mp3_frames(data: bytes) -> Optional[Tuple[Tuple[int, int, int], int, int]]:
+	"""
+	Locate the audio frames of an MP3 stream.
+
+	ID3v2/ID3v1 tags and the Xing/Info/VBRI header frame are excluded, since they
+	describe a single file and would be wrong once streams are joined.
+
+	Args:
+		data (bytes): MP3 data.
+
+	Returns:
+		Optional[Tuple[Tuple[int, int, int], int, int]]: The stream's (version, sample rate, channels)
+			and the start and end offsets of its audio frames, or None if data is not a
+			well-formed MP3 stream with a single format.
+	"""
+	offset = 0
+	# Skip ID3v2 tags, whose size is stored as a 28-bit syncsafe integer
+	while data[offset:offset + 3] == b'ID3' and offset + 10 <= len(data):
+		size = (data[offset + 6] << 21) | (data[offset + 7] << 14) | (data[offset + 8] << 7) | data[offset + 9]
+		footer = 10 if data[offset + 5] & 0x10 else 0
+		offset += 10 + size + footer
+
+	header = parse_mp3_header(data, offset)
+	if header is None:
+		return None
+	signature, frame_length, has_crc = header
+
+	start = offset
+	version, _, channels = signature
+	if version == MPEG_1:
+		side_info_length = 17 if channels == 1 else 32
+	else:
+		side_info_length = 9 if channels == 1 else 17
+	xing_offset = offset + 4 + (2 if has_crc else 0) + side_info_length
+	if data[xing_offset:xing_offset + 4] in (b'Xing', b'Info') or data[offset + 36:offset + 40] == b'VBRI':
+		start = offset + frame_length
+
+	offset += frame_length
+	end = len(data)
+	while offset < len(data):
+		header = parse_mp3_header(data, offset)
+		if header is None:
+			if data[offset:offset + 3] == b'TAG' and len(data) - offset == 128:
+				end = offset
+				break
+			return None
+		if header[0] != signature:
+			return None
+		offset += header[1]
+
+	if offset > end:
+		# Last frame is truncated
+		return None
+	return signature, start, end
+
+
+def extract_mp3_frames(
+	data: bytes, signature: Optional[Tuple[int, int, int]] = None
+) -> Tuple[Tuple[int, int, int], bytes]:
+	"""
+	Get the audio frames of an MP3 stream, re-encoding the audio if it doesn't match signature.
+
+	Args:
+		data (bytes): Encoded audio data, usually MP3.
+		signature (Optional[Tuple[int, int, int]]): Required (version, sample rate, channels),
+			e.g. those of earlier frames of the same stream. Any MP3 format is accepted if None.
+
+	Returns:
+		Tuple[Tuple[int, int, int], bytes]: The stream's (version, sample rate, channels) and its audio frames.
+	"""
+	frames = find_mp3_frames(data)
+	if frames is None or (signature is not None and frames[0] != signature):
+		segment = load_segment(data)
+		if signature is not None:
+			_, sample_rate, channels = signature
+			segment = segment.set_frame_rate(sample_rate).set_channels(channels)
+		buffer = io.BytesIO()
+		segment.export(buffer, format='mp3')
+		data = buffer.getvalue()
+		frames = find_mp3_frames(data)
+		if frames is None:
+			raise ValueError("Failed to encode audio as MP3")
+
+	frames_signature, start, end = frames
+	return frames_signature, data[start:end]
+
+
+def concatenate_mp3(sources: Iterable[Union[str, bytes]]) -> Optional[bytes]:
+	"""
+	Concatenate MP3 streams by joining their frames, without decoding or re-encoding.
+
+	Args:
+		sources (Iterable[Union[str, bytes]]): MP3 file paths or MP3 data, in playback order.
+
+	Returns:
+		Optional[bytes]: The concatenated MP3 stream, or None if any source is not an MP3
+			stream or the sources differ in MPEG version, sample rate or channel count.
+	"""
+	parts: List[memoryview] = []
+	signature = None
+
+	for source in sources:
+		if isinstance(source, str):
+			with open(source, 'rb') as f:
+				source = f.read()
+		frames = find_mp3_frames(source)
+		if frames is None:
+			return None
+		frames_signature, start, end = frames
+		if signature is None:
+			signature = frames_signature
+		elif frames_signature != signature:
+			logger.debug(f"MP3 formats differ: {signature} vs {frames_signature}")
+			return None
+		parts.append(memoryview(source)[start:end])
+
+	if signature is None:
+		return None
+	return b''.join(parts)
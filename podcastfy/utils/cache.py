@@ -0,0 +1,212 @@
+"""
+Cache Module
+
+This module provides a persistent on-disk cache used to avoid repeating expensive
+work such as text-to-speech synthesis. Entries are content-addressed by a hash key
+and evicted in least-recently-used order once the cache exceeds its size limit.
+Entries can optionally expire a fixed time after they were written.
+
+Components should get their cache with DiskCache.shared(), so that every user of a
+directory shares one instance, its size accounting and a single initial scan.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+	# Eviction frees space down to this share of max_size_bytes, so that a full cache
+	# isn't scanned again on every write
+	LOW_WATER_RATIO = 0.9
+
+	_instances: Dict[str, 'DiskCache'] = {}
+	_instances_lock = threading.Lock()
+
+	def __init__(self, directory: str, max_size_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None):
+		"""
+		Initialize the DiskCache.
+
+		Args:
+			directory (str): Directory where cache entries are stored.
+			max_size_bytes (Optional[int]): Maximum total size of the cache. Least recently
+				used entries are evicted once it is exceeded. None means unbounded.
+			ttl_seconds (Optional[float]): Time after which an entry expires, counted from
+				when it was written. None means entries never expire.
+		"""
+		self.directory = directory
+		self.max_size_bytes = max_size_bytes
+		self.ttl_seconds = ttl_seconds
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+
+		os.makedirs(self.directory, exist_ok=True)
+		self._size = sum(size for _, _, size in self._entries())
+
+	@classmethod
+	def shared(
+		cls, directory: str, max_size_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None
+	) -> 'DiskCache':
+		"""
+		Get the process-wide cache instance of a directory, creating it if needed.
+
+		The size limit and TTL of an existing instance are updated to the given values.
+
+		Args:
+			directory (str): Directory where cache entries are stored.
+			max_size_bytes (Optional[int]): Maximum total size of the cache. None means unbounded.
+			ttl_seconds (Optional[float]): Time after which an entry expires. None means never.
+
+		Returns:
+			DiskCache: The shared cache of the directory.
+		"""
+		path = os.path.realpath(directory)
+		with cls._instances_lock:
+			cache = cls._instances.get(path)
+			if cache is None:
+				cache = cls._instances[path] = cls(directory, max_size_bytes, ttl_seconds)
+			else:
+				cache.max_size_bytes = max_size_bytes
+				cache.ttl_seconds = ttl_seconds
+		return cache
+
+	@staticmethod
+	def make_key(*parts: Any) -> str:
+		"""
+		Build a cache key by hashing the given parts.
+
+		Args:
+			*parts: Values identifying the cached content.
+
+		Returns:
+			str: Hex digest usable as a cache key.
+		"""
+		digest = hashlib.sha256()
+		for part in parts:
+			digest.update(str(part).encode('utf-8'))
+			digest.update(b'\0')
+		return digest.hexdigest()
+
+	def get(self, key: str) -> Optional[bytes]:
+		"""
+		Get a cached value.
+
+		Args:
+			key (str): The cache key.
+
+		Returns:
+			Optional[bytes]: The cached value, or None on a cache miss.
+		"""
+		path = self._path(key)
+		try:
+			with open(path, 'rb') as f:
+				modified_time = os.fstat(f.fileno()).st_mtime
+				value = f.read()
+		except FileNotFoundError:
+			with self._lock:
+				self.misses += 1
+			return None
+
+		if self.ttl_seconds is not None and time.time() - modified_time > self.ttl_seconds:
+			self._remove(path)
+			with self._lock:
+				self.misses += 1
+			return None
+
+		# Refresh the access time so eviction is least-recently-used. The modification
+		# time is kept, since it records when the entry was written.
+		try:
+			os.utime(path, (time.time(), modified_time))
+		except OSError:
+			pass
+
+		with self._lock:
+			self.hits += 1
+		return value
+
+	def set(self, key: str, value: bytes) -> None:
+		"""
+		Store a value in the cache, evicting old entries if the size limit is exceeded.
+
+		Args:
+			key (str): The cache key.
+			value (bytes): The value to store.
+		"""
+		path = self._path(key)
+		entry_dir = os.path.dirname(path)
+		os.makedirs(entry_dir, exist_ok=True)
+
+		# Write to a temporary file first so readers never see partial entries
+		fd, temp_path = tempfile.mkstemp(dir=entry_dir, prefix='.tmp')
+		with os.fdopen(fd, 'wb') as f:
+			f.write(value)
+
+		with self._lock:
+			previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+			os.replace(temp_path, path)
+			self._size += len(value) - previous_size
+			self._evict()
+
+	def clear(self) -> None:
+		"""Remove all entries from the cache."""
+		with self._lock:
+			shutil.rmtree(self.directory, ignore_errors=True)
+			os.makedirs(self.directory, exist_ok=True)
+			self._size = 0
+
+	@property
+	def stats(self) -> Dict[str, int]:
+		"""Get hit/miss counters and the current cache size in bytes."""
+		return {'hits': self.hits, 'misses': self.misses, 'size_bytes': self._size}
+
+	def _path(self, key: str) -> str:
+		"""Get the file path of a cache entry."""
+		return os.path.join(self.directory, key[:2], key)
+
+	def _remove(self, path: str) -> None:
+		"""Remove an expired cache entry."""
+		with self._lock:
+			try:
+				size = os.path.getsize(path)
+				os.remove(path)
+			except OSError:
+				return
+			self._size -= size
+		logger.debug(f"Removed expired cache entry {path}")
+
+	def _entries(self) -> Iterator[Tuple[str, float, int]]:
+		"""Yield (path, access time, size) for every cache entry."""
+		for root, _, files in os.walk(self.directory):
+			for name in files:
+				if name.startswith('.tmp'):
+					continue
+				path = os.path.join(root, name)
+				try:
+					stat = os.stat(path)
+				except OSError:
+					continue
+				yield path, stat.st_atime, stat.st_size
+
+	def _evict(self) -> None:
+		"""Evict least recently used entries once the cache exceeds its size limit, down to the low-water mark."""
+		if not self.max_size_bytes or self._size <= self.max_size_bytes:
+			return
+
+		target_size = int(self.max_size_bytes * self.LOW_WATER_RATIO)
+		for path, _, size in sorted(self._entries(), key=lambda entry: entry[1]):
+			if self._size <= target_size:
+				break
+			try:
+				os.remove(path)
+			except OSError:
+				continue
+			self._size -= size
+			logger.debug(f"Evicted cache entry {path}")
@@ -0,0 +1,119 @@
+"""
+Prompt Cache Module
+
+This module caches prompt templates pulled from the LangChain hub. Prompts pinned to
+a commit hash are immutable, so they are fetched once, stored on disk and served
+from memory afterwards. This keeps the hub off the critical path of every episode
+and lets generation run without hub access once the cache is seeded.
+
+The cache can be pre-seeded with all prompts referenced in config.yaml by running:
+
+	python -m podcastfy.utils.prompt_cache
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from langchain import hub
+from langchain_core.load import dumps, loads
+
+from podcastfy.utils.cache import DiskCache
+from podcastfy.utils.config import load_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = "./data/cache/prompts"
+
+# Keys of the content_generator config holding (template, commit) pairs
+PROMPT_CONFIG_KEYS = [
+	("prompt_template", "prompt_commit"),
+	("longform_prompt_template", "longform_prompt_commit"),
+	("cleaner_prompt_template", "cleaner_prompt_commit"),
+	("rewriter_prompt_template", "rewriter_prompt_commit"),
+]
+
+_memory: Dict[Tuple[str, str], Any] = {}
+_lock = threading.Lock()
+
+
+def _get_disk_cache() -> DiskCache:
+	"""Get the on-disk prompt cache configured in config.yaml."""
+	content_generator_config = load_config().get("content_generator", {})
+	directory = content_generator_config.get("prompt_cache_dir", DEFAULT_CACHE_DIRECTORY)
+	return DiskCache.shared(directory)
+
+
+def pull_prompt(template: str, commit: Optional[str] = None, disk_cache: Optional[DiskCache] = None) -> Any:
+	"""
+	Get a prompt template from the LangChain hub, using the cache if possible.
+
+	Prompts without a commit may change on the hub and are always pulled.
+
+	Args:
+		template (str): Hub prompt name, e.g. "souzatharsis/podcastfy_longform".
+		commit (Optional[str]): Commit hash the prompt is pinned to.
+		disk_cache (Optional[DiskCache]): On-disk cache to use. Defaults to the one in config.yaml.
+
+	Returns:
+		Any: The prompt template.
+	"""
+	if not commit:
+		return hub.pull(template)
+
+	key = (template, commit)
+	with _lock:
+		if key in _memory:
+			return _memory[key]
+
+	disk_cache = disk_cache or _get_disk_cache()
+	disk_key = DiskCache.make_key(template, commit)
+	cached = disk_cache.get(disk_key)
+	prompt = None
+	if cached is not None:
+		try:
+			prompt = loads(cached.decode("utf-8"))
+		except Exception as e:
+			logger.warning(f"Ignoring unreadable cached prompt {template}:{commit}: {str(e)}")
+
+	if prompt is None:
+		logger.info(f"Pulling prompt {template}:{commit} from the hub")
+		prompt = hub.pull(f"{template}:{commit}")
+		disk_cache.set(disk_key, dumps(prompt).encode("utf-8"))
+
+	with _lock:
+		_memory[key] = prompt
+	return prompt
+
+
+def clear_memory_cache() -> None:
+	"""Drop prompts cached in memory. The on-disk cache is kept."""
+	with _lock:
+		_memory.clear()
+
+
+def seed_prompts(config: Optional[Dict[str, Any]] = None) -> int:
+	"""
+	Pull every prompt referenced in the content_generator config into the cache.
+
+	Args:
+		config (Optional[Dict[str, Any]]): content_generator configuration. Defaults to config.yaml.
+
+	Returns:
+		int: Number of prompts cached.
+	"""
+	if config is None:
+		config = load_config().get("content_generator", {})
+
+	count = 0
+	for template_key, commit_key in PROMPT_CONFIG_KEYS:
+		template, commit = config.get(template_key), config.get(commit_key)
+		if template and commit:
+			pull_prompt(template, commit)
+			count += 1
+	return count
+
+
+if __name__ == "__main__":
+	logging.basicConfig(level=logging.INFO)
+	print(f"Cached {seed_prompts()} prompts")
@@ -0,0 +1,182 @@
+"""
+Segmenter Module
+
+This module splits text into sentences and token-budgeted chunks. Sentences and
+chunks are returned as (start, end) spans into the original string, so the text
+is scanned once and never copied as a whole, which keeps segmentation linear-time
+and low-memory on inputs of many megabytes such as long PDFs.
+"""
+
+import re
+from typing import Callable, Iterator, List, Tuple
+
+from podcastfy.utils.tokens import estimate_tokens
+
+Span = Tuple[int, int]
+
+# Sentence terminators, including closing quotes/brackets, a blank line, or a line
+# break before a capitalized line or a list item. Latin terminators only end a
+# sentence before whitespace, which excludes e.g. "1.5".
+SENTENCE_END_PATTERN = re.compile(
+	r'[.!?]+["\'”’)\]]*(?=\s|$)'
+	r'|[。！？]+["\'”’」』)\]]*'
+	r'|\n[ \t]*\n'
+	r'|\n(?=[ \t]*(?:[A-Z]|[-*•][ \t]|\d+[.)][ \t]))'
+)
+
+# Lowercase words that are usually followed by a period without ending a sentence
+ABBREVIATIONS = frozenset({
+	'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'e.g', 'i.e',
+	'cf', 'al', 'fig', 'vol', 'inc', 'ltd', 'co', 'corp', 'approx', 'dept',
+	'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+})
+
+# Abbreviations that are also common words, only treated as such before a number, e.g. "No. 5"
+NUMBER_ABBREVIATIONS = frozenset({'no', 'nos'})
+
+# Dotted uppercase acronyms before their final period, e.g. "U.S" in "U.S. growth"
+ACRONYM_PATTERN = re.compile(r'(?:[A-Z]\.)+[A-Z]')
+
+# Longest abbreviation we look back for, in characters
+MAX_ABBREVIATION_LENGTH = 8
+
+# Start of the text following a period, skipping whitespace
+NEXT_WORD_PATTERN = re.compile(r'\s*(\S?)')
+
+
+def _is_abbreviation(text: str, match: re.Match) -> bool:
+	"""Check whether a single period ends an abbreviation, initial or list number rather than a sentence."""
+	if match.group(0) != '.':
+		return False
+	end = match.start()
+	start = end
+	while start > 0 and end - start <= MAX_ABBREVIATION_LENGTH and not text[start - 1].isspace():
+		start -= 1
+	word = text[start:end].lstrip('("\'“‘[')
+	if ACRONYM_PATTERN.fullmatch(word):
+		return True
+	if word.isdigit():
+		# Numbered list items, e.g. "2. Sales rose", start a line
+		line_start = start
+		while line_start > 0 and text[line_start - 1] in ' \t':
+			line_start -= 1
+		return line_start == 0 or text[line_start - 1] == '\n'
+	word = word.lower()
+	if word in NUMBER_ABBREVIATIONS:
+		# "The answer is no. Next..." ends a sentence, "see No. 5" doesn't
+		return NEXT_WORD_PATTERN.match(text, match.end()).group(1).isdigit()
+	# Single letters other than the pronoun "I" are initials, e.g. "J. R. R. Tolkien"
+	return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha() and word != 'i')
+
+
+def _trim(text: str, start: int, end: int) -> Span:
+	"""Shrink a span to exclude leading and trailing whitespace."""
+	while start < end and text[start].isspace():
+		start += 1
+	while end > start and text[end - 1].isspace():
+		end -= 1
+	return start, end
+
+
+def iter_sentence_spans(text: str) -> Iterator[Span]:
+	"""
+	Split text into sentences.
+
+	Sentences end at '.', '!' or '?' followed by whitespace, at CJK sentence
+	terminators, at blank lines and at line breaks before a capitalized line or
+	a list item. Periods after common abbreviations, initials, dotted acronyms
+	such as "U.S." and list numbers do not end a sentence.
+
+	Args:
+		text (str): The text to segment.
+
+	Yields:
+		Span: (start, end) offsets of each sentence, excluding surrounding whitespace.
+	"""
+	start = 0
+	for match in SENTENCE_END_PATTERN.finditer(text):
+		if _is_abbreviation(text, match):
+			continue
+		span_start, span_end = _trim(text, start, match.end())
+		if span_start < span_end:
+			yield span_start, span_end
+		start = match.end()
+
+	span_start, span_end = _trim(text, start, len(text))
+	if span_start < span_end:
+		yield span_start, span_end
+
+
+def _split_span(
+	text: str, start: int, end: int, max_tokens: int, count_tokens: Callable[[str], int]
+) -> Iterator[Tuple[int, int, int]]:
+	"""
+	Split a span longer than max_tokens into pieces that fit, ending at whitespace where possible.
+
+	Yields:
+		Tuple[int, int, int]: (start, end, tokens) of each piece.
+	"""
+	tokens = count_tokens(text[start:end])
+	if tokens <= max_tokens:
+		yield start, end, tokens
+		return
+
+	piece_chars = max(1, (end - start) * max_tokens // tokens)
+	while start < end:
+		piece_end = min(end, start + piece_chars)
+		if piece_end < end:
+			space = text.rfind(' ', start, piece_end)
+			if space > start:
+				piece_end = space + 1
+		piece_start, trimmed_end = _trim(text, start, piece_end)
+		if piece_start < trimmed_end:
+			yield piece_start, trimmed_end, count_tokens(text[piece_start:trimmed_end])
+		start = piece_end
+
+
+def iter_chunk_spans(
+	text: str, max_tokens: int, count_tokens: Callable[[str], int] = estimate_tokens
+) -> Iterator[Span]:
+	"""
+	Pack whole sentences into chunks of up to max_tokens tokens.
+
+	Sentences longer than max_tokens are split at whitespace, or anywhere in text
+	without spaces, so that every chunk fits.
+
+	Args:
+		text (str): The text to chunk.
+		max_tokens (int): Maximum number of tokens of each chunk.
+		count_tokens (Callable[[str], int]): Counts the tokens of a string.
+
+	Yields:
+		Span: (start, end) offsets of each chunk, excluding surrounding whitespace.
+	"""
+	chunk_start = chunk_end = None
+	chunk_tokens = 0
+
+	for sentence_start, sentence_end in iter_sentence_spans(text):
+		for start, end, tokens in _split_span(text, sentence_start, sentence_end, max_tokens, count_tokens):
+			if chunk_start is not None and chunk_tokens + tokens > max_tokens:
+				yield chunk_start, chunk_end
+				chunk_start = None
+				chunk_tokens = 0
+			if chunk_start is None:
+				chunk_start = start
+			chunk_end = end
+			chunk_tokens += tokens
+
+	if chunk_start is not None:
+		yield chunk_start, chunk_end
+
+
+def split_sentences(text: str) -> List[str]:
+	"""
+	Split text into a list of sentences.
+
+	Args:
+		text (str): The text to segment.
+
+	Returns:
+		List[str]: The sentences, in order.
+	"""
+	return [text[start:end] for start, end in iter_sentence_spans(text)]
@@ -0,0 +1,81 @@
+"""
+Token Utilities Module
+
+This module provides token counts used to keep LLM prompts within a budget and to
+size long-form chunks. Counts use tiktoken when it is installed. Otherwise they are
+estimated from the text: CJK characters are roughly one token each, while other
+text averages about four characters per token.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Average number of characters per token for English text
+CHARS_PER_TOKEN = 4
+
+# Han, Hiragana, Katakana, Hangul and CJK punctuation/fullwidth forms
+CJK_PATTERN = re.compile(r'[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]')
+
+TIKTOKEN_ENCODING = "cl100k_base"
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding() -> Optional[object]:
+	"""Get the tiktoken encoding, or None if tiktoken or its encoding file is unavailable."""
+	global _encoding, _encoding_loaded
+	if not _encoding_loaded:
+		_encoding_loaded = True
+		try:
+			import tiktoken
+			_encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+		except Exception as e:
+			logger.debug(f"tiktoken unavailable, estimating token counts: {str(e)}")
+	return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+	"""
+	Estimate the number of tokens in a text.
+
+	Args:
+		text (str): The text to measure.
+
+	Returns:
+		int: Token count, exact if tiktoken is installed and approximate otherwise.
+	"""
+	if not text:
+		return 0
+	encoding = _get_encoding()
+	if encoding is not None:
+		return len(encoding.encode(text, disallowed_special=()))
+
+	cjk_chars = len(CJK_PATTERN.findall(text))
+	other_chars = len(text) - cjk_chars
+	return max(1, cjk_chars + -(-other_chars // CHARS_PER_TOKEN))
+
+
+def token_stats(texts: List[str]) -> Dict[str, Any]:
+	"""
+	Compute the token counts of a list of texts, e.g. long-form chunks.
+
+	Args:
+		texts (List[str]): The texts to measure.
+
+	Returns:
+		Dict[str, Any]: Per-text token 'counts', and their 'total', 'min', 'max' and 'mean'.
+	"""
+	counts = [estimate_tokens(text) for text in texts]
+	if not counts:
+		return {'counts': [], 'total': 0, 'min': 0, 'max': 0, 'mean': 0}
+	return {
+		'counts': counts,
+		'total': sum(counts),
+		'min': min(counts),
+		'max': max(counts),
+		'mean': sum(counts) // len(counts),
+	}
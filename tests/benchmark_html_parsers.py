@@ -0,0 +1,31 @@
+"""
+Benchmark the HTML parser backends of WebsiteExtractor on a saved news page.
+
+Run from the repository root:
+
+    python -m tests.benchmark_html_parsers
+"""
+
+import time
+
+from podcastfy.content_parser.website_extractor import WebsiteExtractor
+
+PAGE_PATH = "./tests/data/mock/website.html"
+
+
+def main(repeat: int = 20) -> None:
+    with open(PAGE_PATH, "r") as f:
+        page = f.read()
+
+    extractor = WebsiteExtractor()
+    parsers = ["html.parser"] + (["lxml"] if WebsiteExtractor._resolve_parser("lxml") == "lxml" else [])
+    for parser in parsers:
+        extractor.parser = parser
+        start = time.perf_counter()
+        for _ in range(repeat):
+            extractor.extract_from_html(page)
+        print(f"{parser}: {(time.perf_counter() - start) / repeat * 1000:.1f} ms per page")
+
+
+if __name__ == "__main__":
+    main()
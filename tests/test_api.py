@@ -1,10 +1,23 @@
 import os
+import time
+import threading
 import pytest
-from podcastfy.api.fast_app import app
-from httpx import WSGITransport
+from unittest.mock import patch
+from podcastfy.api.fast_app import app, TEMP_DIR
 from fastapi.testclient import TestClient
 
-client = TestClient(app, transport=WSGITransport(app=app))
+client = TestClient(app)
+
+
+def wait_for_job(job_id, timeout=600):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        response = client.get(f"/jobs/{job_id}")
+        assert response.status_code == 200
+        if response.json()["status"] in ("completed", "failed"):
+            return response.json()
+        time.sleep(0.05)
+    raise TimeoutError(f"Job {job_id} did not finish")
 
 @pytest.fixture
 def sample_config():
@@ -28,9 +41,82 @@ def sample_config():
 @pytest.mark.skip(reason="Trying to understand if other tests are passing")
 def test_generate_podcast_with_edge_tts(sample_config):
     response = client.post("/generate", json=sample_config)
-    assert response.status_code == 200
-    assert "audioUrl" in response.json()
-    assert response.json()["audioUrl"].startswith("http://testserver")
+    assert response.status_code == 202
+    job = wait_for_job(response.json()["jobId"])
+    assert job["status"] == "completed"
+    result = client.get(f"/jobs/{job['jobId']}/result")
+    assert result.json()["audioUrl"].startswith("/audio/")
+
+def test_generate_podcast_job_queue(sample_config, tmp_path):
+    """Test that /generate returns immediately and the job is tracked until it finishes."""
+    audio_path = tmp_path / "podcast.mp3"
+    audio_path.write_bytes(b"audio")
+    release = threading.Event()
+
+    def fake_generate_podcast(**kwargs):
+        release.wait(10)
+        return str(audio_path)
+
+    with patch("podcastfy.api.fast_app.generate_podcast", side_effect=fake_generate_podcast):
+        response = client.post("/generate", json=sample_config)
+        assert response.status_code == 202
+        job_id = response.json()["jobId"]
+
+        # The server stays responsive while the job runs
+        assert client.get("/health").status_code == 200
+        assert client.get(f"/jobs/{job_id}").json()["status"] in ("queued", "running")
+        assert client.get(f"/jobs/{job_id}/result").status_code == 202
+
+        release.set()
+        assert wait_for_job(job_id)["status"] == "completed"
+
+    result = client.get(f"/jobs/{job_id}/result")
+    assert result.status_code == 200
+    audio = client.get(result.json()["audioUrl"])
+    assert audio.content == b"audio"
+    os.remove(os.path.join(TEMP_DIR, os.path.basename(result.json()["audioUrl"])))
+
+    with patch("podcastfy.api.fast_app.generate_podcast", side_effect=RuntimeError("no content")):
+        job_id = client.post("/generate", json=sample_config).json()["jobId"]
+        assert wait_for_job(job_id)["error"] == "no content"
+    assert client.get(f"/jobs/{job_id}/result").status_code == 500
+    assert client.get("/jobs/unknown").status_code == 404
+
+def test_generate_podcast_passes_api_keys(sample_config, tmp_path):
+    """Test that request API keys are passed to generate_podcast instead of set in os.environ."""
+    audio_path = tmp_path / "podcast.mp3"
+    audio_path.write_bytes(b"audio")
+    calls = []
+
+    def fake_generate_podcast(**kwargs):
+        calls.append(kwargs)
+        return str(audio_path)
+
+    environ = dict(os.environ)
+    with patch("podcastfy.api.fast_app.generate_podcast", side_effect=fake_generate_podcast):
+        data = {**sample_config, "openai_key": "openai-test", "google_key": "gemini-test"}
+        job_id = client.post("/generate", json=data).json()["jobId"]
+        assert wait_for_job(job_id)["status"] == "completed"
+
+    assert calls[0]["config"] == {"OPENAI_API_KEY": "openai-test", "GEMINI_API_KEY": "gemini-test"}
+    assert dict(os.environ) == environ
+    os.remove(os.path.join(TEMP_DIR, os.path.basename(client.get(f"/jobs/{job_id}").json()["audioUrl"])))
+
+def test_expired_jobs_are_pruned_when_polled(sample_config, tmp_path):
+    """Test that polling deletes jobs past their TTL along with their audio files."""
+    audio_path = tmp_path / "podcast.mp3"
+    audio_path.write_bytes(b"audio")
+
+    with patch("podcastfy.api.fast_app.generate_podcast", return_value=str(audio_path)):
+        job_id = client.post("/generate", json=sample_config).json()["jobId"]
+        job = wait_for_job(job_id)
+    assert job["status"] == "completed"
+    output_path = os.path.join(TEMP_DIR, os.path.basename(job["audioUrl"]))
+    assert os.path.exists(output_path)
+
+    with patch("podcastfy.api.fast_app.JOB_TTL_SECONDS", -1):
+        assert client.get(f"/jobs/{job_id}").status_code == 404
+    assert not os.path.exists(output_path)
 
 def test_healthcheck():
     response = client.get("/health")
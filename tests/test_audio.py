@@ -1,7 +1,19 @@
 import unittest
 import pytest
+import asyncio
+import io
 import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 from podcastfy.text_to_speech import TextToSpeech
+from podcastfy.utils.audio import concatenate_audio, concatenate_mp3, find_mp3_frames
+from podcastfy.utils.cache import DiskCache
+from pydub import AudioSegment
+from pydub.generators import Sine
 from podcastfy.utils.config_conversation import load_conversation_config
 
 
@@ -70,6 +82,357 @@ class TestAudio(unittest.TestCase):
         # Clean up
         os.remove(output_file)
 
+    def test_generate_audio_segments_concurrently(self):
+        conversation_config = {
+            "text_to_speech": {"max_concurrency": 3, "cache": {"enabled": False}}
+        }
+        tts = TextToSpeech(model="edge", conversation_config=conversation_config)
+        self.assertEqual(tts.max_concurrency, 3)
+
+        text = "".join(
+            f"<Person1>Question {i}</Person1><Person2>Answer {i}</Person2>"
+            for i in range(6)
+        )
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def fake_generate_audio(content, voice, model):
+            with lock:
+                in_flight.append(content)
+                peak.append(len(in_flight))
+            time.sleep(random.uniform(0, 0.02))
+            with lock:
+                in_flight.remove(content)
+            return content.encode()
+
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            tts.provider, "generate_audio", side_effect=fake_generate_audio
+        ):
+            audio_files = tts._generate_audio_segments(text, temp_dir)
+            contents = []
+            for file_path in audio_files:
+                with open(file_path, "rb") as f:
+                    contents.append(f.read().decode())
+
+        expected = [f"{kind} {i}" for i in range(6) for kind in ("Question", "Answer")]
+        self.assertEqual(contents, expected)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_generate_audio_segments_cached(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            conversation_config = {
+                "text_to_speech": {"cache": {"enabled": True, "directory": cache_dir}}
+            }
+            tts = TextToSpeech(model="edge", conversation_config=conversation_config)
+            with patch.object(
+                tts.provider,
+                "generate_audio",
+                side_effect=lambda content, voice, model: content.encode(),
+            ) as generate_audio:
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    tts._generate_audio_segments(self.test_text, temp_dir)
+                self.assertEqual(generate_audio.call_count, 2)
+
+                # Only the edited turn is synthesized again
+                edited_text = self.test_text.replace("great", "fine")
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    tts._generate_audio_segments(edited_text, temp_dir)
+                self.assertEqual(generate_audio.call_count, 3)
+                self.assertEqual(tts.cache.stats["hits"], 1)
+                self.assertEqual(tts.cache.stats["misses"], 3)
+
+    def test_disk_cache_evicts_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskCache(cache_dir, max_size_bytes=25)
+            cache.set("a" * 64, b"x" * 10)
+            time.sleep(0.01)
+            cache.set("b" * 64, b"x" * 10)
+            time.sleep(0.01)
+            cache.get("a" * 64)
+            cache.set("c" * 64, b"x" * 10)
+
+            self.assertIsNotNone(cache.get("a" * 64))
+            self.assertIsNone(cache.get("b" * 64))
+            self.assertIsNotNone(cache.get("c" * 64))
+            self.assertLessEqual(cache.stats["size_bytes"], 25)
+
+            # Eviction frees space down to the low-water mark, not just below the limit
+            time.sleep(0.01)
+            cache.get("c" * 64)
+            cache.set("d" * 64, b"x" * 10)
+            self.assertEqual(cache.stats["size_bytes"], 20)
+            self.assertIsNone(cache.get("a" * 64))
+
+    def test_disk_cache_shared_per_directory(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskCache.shared(cache_dir, max_size_bytes=100)
+            cache.set("a" * 64, b"x" * 10)
+            shared = DiskCache.shared(os.path.join(cache_dir, "."), max_size_bytes=50)
+            self.assertIs(shared, cache)
+            self.assertEqual(shared.max_size_bytes, 50)
+            self.assertEqual(shared.stats["size_bytes"], 10)
+
+    def test_disk_cache_expires_entries(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = DiskCache(cache_dir, ttl_seconds=60)
+            cache.set("a" * 64, b"x" * 10)
+            self.assertEqual(cache.get("a" * 64), b"x" * 10)
+
+            # Reads refresh the access time but not the write time
+            path = cache._path("a" * 64)
+            os.utime(path, (time.time(), time.time() - 120))
+            self.assertIsNone(cache.get("a" * 64))
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(cache.stats["size_bytes"], 0)
+
+    def test_concatenate_audio_matches_sequential_addition(self):
+        segments = [
+            Sine(440).to_audio_segment(duration=300).set_frame_rate(24000),
+            Sine(660).to_audio_segment(duration=200).set_frame_rate(24000),
+            Sine(880).to_audio_segment(duration=100).set_frame_rate(44100),
+        ]
+        expected = segments[0] + segments[1] + segments[2]
+
+        combined = concatenate_audio(segments)
+
+        self.assertEqual(combined.frame_rate, expected.frame_rate)
+        self.assertEqual(combined.raw_data, expected.raw_data)
+
+    def test_concatenate_mp3_joins_frames(self):
+        def encode(frame_rate):
+            buffer = io.BytesIO()
+            segment = Sine(440).to_audio_segment(duration=500).set_frame_rate(frame_rate)
+            segment.export(buffer, format="mp3")
+            return buffer.getvalue()
+
+        first, second = encode(24000), encode(24000)
+        joined = concatenate_mp3([first, second])
+
+        self.assertIsNotNone(joined)
+        self.assertLess(len(joined), len(first) + len(second))
+        duration = len(AudioSegment.from_file(io.BytesIO(joined), format="mp3"))
+        self.assertGreaterEqual(duration, 1000)
+
+        # Different sample rates cannot be joined without re-encoding
+        self.assertIsNone(concatenate_mp3([first, encode(44100)]))
+        self.assertIsNone(concatenate_mp3([first, b"not an mp3"]))
+
+    def test_find_mp3_frames_skips_info_frame_with_crc(self):
+        # MPEG-1 Layer III, CRC-protected (protection bit 0), 128 kbit/s, 44.1 kHz, stereo: 417-byte frames
+        header = bytes([0xFF, 0xFA, 0x90, 0x40])
+        frame_length = 417
+        # The Info tag follows the header, the 2-byte CRC and 32 bytes of side information
+        info_frame = (header + bytes(2 + 32) + b"Info").ljust(frame_length, b"\0")
+        audio_frame = header.ljust(frame_length, b"\0")
+        data = info_frame + audio_frame * 3
+
+        signature, start, end = find_mp3_frames(data)
+        self.assertEqual(signature, (3, 44100, 2))
+        self.assertEqual((start, end), (frame_length, len(data)))
+
+    def test_stream_to_speech_writes_turns_in_order(self):
+        def encode(duration, frame_rate):
+            buffer = io.BytesIO()
+            segment = Sine(440).to_audio_segment(duration=duration).set_frame_rate(frame_rate)
+            segment.export(buffer, format="mp3")
+            return buffer.getvalue()
+
+        audio = {
+            "Hello, how are you?": encode(300, 24000),
+            # Different sample rate, must be re-encoded to match the stream
+            "I'm doing great, thanks for asking!": encode(600, 44100),
+        }
+        conversation_config = {"text_to_speech": {"cache": {"enabled": False}}}
+        tts = TextToSpeech(model="edge", conversation_config=conversation_config)
+
+        output = io.BytesIO()
+        with patch.object(
+            tts.provider,
+            "generate_audio",
+            side_effect=lambda content, voice, model: audio[content],
+        ):
+            tts.stream_to_speech(self.test_text, output)
+
+        signature, start, end = find_mp3_frames(output.getvalue())
+        self.assertEqual(signature[1:], (24000, 1))
+        self.assertEqual((start, end), (0, len(output.getvalue())))
+        duration = len(AudioSegment.from_file(io.BytesIO(output.getvalue()), format="mp3"))
+        self.assertGreaterEqual(duration, 900)
+
+    def test_stream_multi_speaker_chunks(self):
+        buffer = io.BytesIO()
+        Sine(440).to_audio_segment(duration=300).export(buffer, format="mp3")
+        chunk = buffer.getvalue()
+        progress = []
+
+        def fake_iter_audio(text, **kwargs):
+            progress.append("first")
+            yield chunk
+            progress.append("second")
+            raise RuntimeError("quota exceeded")
+
+        conversation_config = {"text_to_speech": {"cache": {"enabled": False}}}
+        tts = TextToSpeech(model="edge", conversation_config=conversation_config)
+        tts.provider = MagicMock(model="en-US-Studio-MultiSpeaker", iter_audio=fake_iter_audio)
+
+        # The first chunk is available before later chunks are synthesized
+        segments = tts.iter_speech(self.test_text)
+        self.assertTrue(next(segments))
+        self.assertEqual(progress, ["first"])
+
+        # A failed stream leaves no partial file behind
+        output_file = os.path.join(self.output_dir, "test_stream_failed.mp3")
+        with self.assertRaises(RuntimeError):
+            tts.stream_to_speech(self.test_text, output_file)
+        self.assertFalse(os.path.exists(output_file))
+
+    def test_aconvert_to_speech(self):
+        buffer = io.BytesIO()
+        Sine(440).to_audio_segment(duration=300).export(buffer, format="mp3")
+        audio_data = buffer.getvalue()
+
+        async def fake_agenerate_audio(content, voice, model):
+            await asyncio.sleep(0)
+            return audio_data
+
+        conversation_config = {"text_to_speech": {"cache": {"enabled": False}}}
+        tts = TextToSpeech(model="edge", conversation_config=conversation_config)
+        output_file = os.path.join(self.output_dir, "test_aconvert.mp3")
+        with patch.object(
+            tts.provider, "agenerate_audio", side_effect=fake_agenerate_audio
+        ) as agenerate_audio:
+            asyncio.run(tts.aconvert_to_speech(self.test_text, output_file))
+
+        self.assertEqual(agenerate_audio.call_count, 2)
+        self.assertTrue(os.path.exists(output_file))
+        duration = len(AudioSegment.from_file(output_file, format="mp3"))
+        self.assertGreaterEqual(duration, 600)
+
+        # Clean up
+        os.remove(output_file)
+
+    def test_edge_generate_audio_in_memory(self):
+        class FakeCommunicate:
+            def __init__(self, text, voice):
+                pass
+
+            async def stream(self):
+                yield {"type": "audio", "data": b"ab"}
+                yield {"type": "WordBoundary", "offset": 0}
+                yield {"type": "audio", "data": b"cd"}
+
+        tts = TextToSpeech(model="edge")
+        with patch("podcastfy.tts.providers.edge.edge_tts.Communicate", FakeCommunicate), patch(
+            "tempfile.NamedTemporaryFile"
+        ) as named_temporary_file:
+            audio_data = tts.provider.generate_audio("Hello", "en-US-JennyNeural", "default")
+
+        self.assertEqual(audio_data, b"abcd")
+        named_temporary_file.assert_not_called()
+
+        # Worker threads close the event loops they create
+        loops = []
+
+        async def fake_agenerate_audio(text, voice, model):
+            loops.append(asyncio.get_running_loop())
+            return b"audio"
+
+        with patch.object(tts.provider, "agenerate_audio", side_effect=fake_agenerate_audio):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(lambda text: tts.provider.generate_audio(text, "voice", "default"), ["a", "b", "c"]))
+        self.assertEqual(results, [b"audio"] * 3)
+        self.assertTrue(all(loop.is_closed() for loop in loops))
+
+    def test_gemini_multi_synthesizes_chunks_in_parallel(self):
+        from google.api_core import exceptions as google_exceptions
+        from podcastfy.tts.providers.geminimulti import GeminiMultiTTS
+
+        text = "".join(
+            f"<Person1>Question {i}? {'x' * 400}</Person1><Person2>Answer {i}. {'y' * 400}</Person2>"
+            for i in range(6)
+        )
+        provider = GeminiMultiTTS(api_key="test")
+        provider.initial_backoff = 0
+        failed = set()
+        lock = threading.Lock()
+
+        class Response:
+            def __init__(self, audio_content):
+                self.audio_content = audio_content
+
+        def synthesize_speech(input, voice, audio_config):
+            first_turn = input.multi_speaker_markup.turns[0].text
+            time.sleep(random.uniform(0, 0.02))
+            with lock:
+                # Every chunk hits the quota once before succeeding
+                if first_turn not in failed:
+                    failed.add(first_turn)
+                    raise google_exceptions.ResourceExhausted("quota")
+            return Response(first_turn.encode())
+
+        with patch.object(provider.client, "synthesize_speech", side_effect=synthesize_speech):
+            audio_chunks = provider.generate_audio(text, max_workers=4)
+
+        expected = [
+            provider._build_synthesis_input(chunk, "R", "S").multi_speaker_markup.turns[0].text.encode()
+            for chunk in provider.chunk_text(text)
+        ]
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(audio_chunks, expected)
+
+    def test_gemini_multi_merge_audio_in_memory(self):
+        from podcastfy.tts.providers.geminimulti import GeminiMultiTTS
+
+        chunks = []
+        for frame_rate in (24000, 44100):
+            buffer = io.BytesIO()
+            Sine(440, sample_rate=frame_rate).to_audio_segment(duration=500).export(buffer, format="mp3")
+            chunks.append(buffer.getvalue())
+        # Different sample rates force the decode and re-encode path
+        self.assertIsNone(concatenate_mp3(chunks))
+
+        provider = GeminiMultiTTS(api_key="test")
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                merged = provider.merge_audio(chunks)
+                self.assertEqual(os.listdir(temp_dir), [])
+            finally:
+                os.chdir(cwd)
+
+        self.assertAlmostEqual(len(AudioSegment.from_file(io.BytesIO(merged), format="mp3")), 1000, delta=100)
+
+    def test_tts_providers_are_pooled(self):
+        from podcastfy.tts.factory import TTSProviderFactory
+
+        provider = TextToSpeech(model="edge").provider
+        self.assertIs(TextToSpeech(model="edge").provider, provider)
+        self.assertIsNot(TTSProviderFactory.create("edge", api_key="other", model="edge"), provider)
+        self.assertIsNot(TTSProviderFactory.create("edge", model="edge", pooled=False), provider)
+
+        TTSProviderFactory.clear_pool()
+        self.assertIsNot(TextToSpeech(model="edge").provider, provider)
+
+        # The pool keeps only the most recently used instances
+        first = TTSProviderFactory.create("edge", api_key="tenant-0", model="edge")
+        for i in range(1, TTSProviderFactory.max_pool_size + 1):
+            TTSProviderFactory.create("edge", api_key=f"tenant-{i}", model="edge")
+        self.assertEqual(len(TTSProviderFactory._pool), TTSProviderFactory.max_pool_size)
+        self.assertIsNot(TTSProviderFactory.create("edge", api_key="tenant-0", model="edge"), first)
+        TTSProviderFactory.clear_pool()
+
+    def test_async_client_per_event_loop(self):
+        provider = TextToSpeech(model="edge").provider
+
+        async def get_client():
+            first = provider.get_async_client(object)
+            self.assertIs(provider.get_async_client(object), first)
+            return first
+
+        self.assertIsNot(asyncio.run(get_client()), asyncio.run(get_client()))
+
 
 if __name__ == "__main__":
     unittest.main()
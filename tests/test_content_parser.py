@@ -1,5 +1,12 @@
 import unittest
+import asyncio
+import os
+import tempfile
+import threading
+import time
 import pytest
+from unittest.mock import patch
+import requests
 from podcastfy.utils.config import load_config
 from podcastfy.content_parser.content_extractor import ContentExtractor
 from podcastfy.content_parser.youtube_transcriber import YouTubeTranscriber
@@ -103,6 +110,315 @@ class TestContentParser(unittest.TestCase):
             "Generated content should be relevant to the topic",
         )
 
+    def test_extract_contents_concurrently(self):
+        """
+        Test that batch extraction keeps input order, reports failures per source and limits requests per host.
+        """
+        extractor = ContentExtractor()
+        extractor.max_per_host = 2
+        sources = [f"https://site{i % 2}.example.com/article{i}" for i in range(8)]
+        sources.insert(3, "https://site0.example.com/broken")
+        active = {}
+        peak = {}
+        lock = threading.Lock()
+
+        def fake_extract(source):
+            host = source.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            if source.endswith("broken"):
+                raise ValueError("Failed to fetch")
+            return f"content of {source}"
+
+        with patch.object(extractor, "extract_content", side_effect=fake_extract):
+            results = extractor.extract_contents(sources, max_workers=8)
+            async_results = asyncio.run(extractor.aextract_contents(sources, max_workers=8))
+
+        # The limit holds across extractors, e.g. concurrent generation jobs
+        peak.clear()
+        other = ContentExtractor()
+        other.max_per_host = 2
+        with patch.object(extractor, "extract_content", side_effect=fake_extract), patch.object(
+            other, "extract_content", side_effect=fake_extract
+        ):
+            threads = [threading.Thread(target=e.extract_contents, args=(sources, 8)) for e in (extractor, other)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(peak, {"site0.example.com": 2, "site1.example.com": 2})
+
+        for batch in (results, async_results):
+            self.assertEqual([result.source for result in batch], sources)
+            self.assertEqual([result.ok for result in batch], [source != sources[3] for source in sources])
+            self.assertIsInstance(batch[3].error, ValueError)
+            self.assertEqual(batch[0].content, f"content of {sources[0]}")
+        self.assertEqual(peak, {"site0.example.com": 2, "site1.example.com": 2})
+
+    def test_website_extractor_conditional_get(self):
+        """
+        Test that cached pages are revalidated with a conditional request and reused on 304.
+        """
+        from podcastfy.utils.cache import DiskCache
+
+        class FakeResponse:
+            def __init__(self, status_code, text="", headers=None):
+                self.status_code = status_code
+                self.text = text
+                self.headers = headers or {}
+
+            def raise_for_status(self):
+                if self.status_code >= 400:
+                    raise requests.HTTPError(str(self.status_code))
+
+        page = "<html><body><nav>Menu</nav><p>Hello podcast world</p></body></html>"
+        requests_headers = []
+
+        def fake_get(url, headers, timeout):
+            requests_headers.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, page, {"ETag": '"v1"'})
+
+        extractor = WebsiteExtractor()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            extractor.http_cache = DiskCache(cache_dir)
+            with patch.object(extractor, "session") as session:
+                session.get.side_effect = fake_get
+                first = extractor.extract_content("https://example.com/page")
+                with patch.object(extractor, "remove_unwanted_elements") as remove_unwanted_elements:
+                    second = extractor.extract_content("https://example.com/page")
+                    remove_unwanted_elements.assert_not_called()
+
+        self.assertEqual(first, "Hello podcast world")
+        self.assertEqual(second, first)
+        self.assertNotIn("If-None-Match", requests_headers[0])
+        self.assertEqual(requests_headers[1]["If-None-Match"], '"v1"')
+
+    def test_website_extractor_parsers(self):
+        """
+        Test that HTML parser backends extract the same text from a saved news page.
+        """
+        with open("./tests/data/mock/website.html", "r") as f:
+            page = f.read()
+
+        extractor = WebsiteExtractor()
+        parsers = ["html.parser"] + (["lxml"] if WebsiteExtractor._resolve_parser("lxml") == "lxml" else [])
+        results = {}
+        for parser in parsers:
+            extractor.parser = parser
+            results[parser] = extractor.extract_from_html(page)
+
+        content = results["html.parser"]
+        self.assertIn("Open models change how podcasts are made", content)
+        for unwanted in ["loadAd", "dataLayer", "Subscribe to our newsletter", "All rights reserved"]:
+            self.assertNotIn(unwanted, content)
+        self.assertEqual(len(set(results.values())), 1)
+
+    def test_website_extractor_clean_content(self):
+        """
+        Test that clean_content applies the configured patterns in order, as separate re.sub passes would.
+        """
+        import html
+        import re
+
+        extractor = WebsiteExtractor()
+
+        def reference_clean(content):
+            content = re.sub(r"\s+", " ", html.unescape(content))
+            for pattern in extractor.remove_patterns:
+                content = re.sub(pattern, "", content)
+            return content.strip()
+
+        samples = [
+            "Hello &amp; welcome\n\n\n\tto the [show](link)",
+            "(x[y)z] tail",
+            " - item one\n2. item two\n## Heading",
+            "[a] - (b) # c",
+        ]
+        for sample in samples:
+            self.assertEqual(extractor.clean_content(sample), reference_clean(sample))
+
+    def test_pdf_extractor_pages(self):
+        """
+        Test that page-by-page and parallel page-range extraction match whole-document extraction.
+        """
+        import unicodedata
+        import pymupdf
+
+        pdf_path = "./tests/data/pdf/file.pdf"
+        with pymupdf.open(pdf_path) as doc:
+            page_count = doc.page_count
+            expected = unicodedata.normalize("NFKD", " ".join(page.get_text() for page in doc))
+
+        extractor = PDFExtractor()
+        pages = list(extractor.iter_pages(pdf_path))
+        self.assertEqual(len(pages), page_count)
+        self.assertEqual(extractor.extract_content(pdf_path, max_workers=1), expected)
+
+        extractor.parallel_min_pages = 1
+        self.assertEqual(extractor.extract_content(pdf_path, max_workers=2), expected)
+
+        # Parallel extractions share one process pool
+        from podcastfy.content_parser import pdf_extractor
+        pool = pdf_extractor._process_pool
+        self.assertIsNotNone(pool)
+        self.assertEqual(extractor.extract_content(pdf_path, max_workers=2), expected)
+        self.assertIs(pdf_extractor._process_pool, pool)
+
+        # A larger request replaces the pool instead of being capped by the first caller
+        self.assertEqual(extractor.extract_content(pdf_path, max_workers=3), expected)
+        self.assertIsNot(pdf_extractor._process_pool, pool)
+        self.assertEqual(pdf_extractor._process_pool_workers, 3)
+        pool = pdf_extractor._process_pool
+
+        # An error raised in a worker falls back without discarding the pool
+        with patch.object(pool, "map", side_effect=ValueError("bad page")):
+            self.assertEqual(extractor.extract_content(pdf_path, max_workers=2), expected)
+        self.assertIs(pdf_extractor._process_pool, pool)
+
+        # Any failure of the worker processes falls back to in-process extraction
+        with patch.object(extractor, "_extract_parallel", side_effect=RuntimeError("bootstrapping")):
+            self.assertEqual(extractor.extract_content(pdf_path, max_workers=2), expected)
+
+    def test_content_extractor_cache(self):
+        """
+        Test that extracted content is reused until the source's fingerprint changes.
+        """
+        import shutil
+        from unittest.mock import MagicMock
+        from podcastfy.utils.cache import DiskCache
+
+        extractor = ContentExtractor()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            extractor.cache = DiskCache(os.path.join(temp_dir, "cache"))
+
+            # Local PDFs are keyed on a hash of the file
+            pdf_path = os.path.join(temp_dir, "file.pdf")
+            shutil.copy("./tests/data/pdf/file.pdf", pdf_path)
+            with patch.object(extractor.pdf_extractor, "extract_content", side_effect=["v1", "v2"]) as extract_pdf:
+                self.assertEqual(extractor.extract_content(pdf_path), "v1")
+                self.assertEqual(extractor.extract_content(pdf_path), "v1")
+                with open(pdf_path, "ab") as f:
+                    f.write(b"\n")
+                self.assertEqual(extractor.extract_content(pdf_path), "v2")
+                self.assertEqual(extract_pdf.call_count, 2)
+
+            # Pages revalidated by the website extractor's HTTP cache bypass the extraction cache
+            with patch.object(extractor.website_extractor, "session") as session, patch.object(
+                extractor.website_extractor, "extract_content", return_value="page"
+            ) as extract_page:
+                extractor.website_extractor.http_cache = DiskCache(os.path.join(temp_dir, "http"))
+                self.assertEqual(extractor.extract_content("https://example.com/article"), "page")
+                self.assertEqual(extractor.extract_content("https://example.com/article"), "page")
+                self.assertEqual(extract_page.call_count, 2)
+                session.head.assert_not_called()
+
+            # Otherwise web pages are keyed on URL and validators
+            extractor.website_extractor.http_cache = None
+            etags = ['"a"', '"a"', '"b"']
+            with patch.object(extractor.website_extractor, "session") as session, patch.object(
+                extractor.website_extractor, "extract_content", side_effect=["page a", "page b", "page b"]
+            ) as extract_page:
+                session.head.side_effect = lambda *args, **kwargs: MagicMock(
+                    ok=True, headers={"ETag": etags.pop(0)}
+                )
+                url = "https://example.com/article"
+                self.assertEqual(extractor.extract_content(url), "page a")
+                self.assertEqual(extractor.extract_content(url), "page a")
+                self.assertEqual(extractor.extract_content(url), "page b")
+                self.assertEqual(extractor.extract_content(url, use_cache=False), "page b")
+                self.assertEqual(extract_page.call_count, 3)
+
+    def test_youtube_transcriber_batch(self):
+        """Test video ID parsing, batch fetching and the transcript cache without network access."""
+        from podcastfy.content_parser.youtube_transcriber import get_video_id
+        from podcastfy.utils.cache import DiskCache
+
+        video_id = "m3kJo5kEzTQ"
+        for url in [
+            f"https://www.youtube.com/watch?v={video_id}",
+            f"https://www.youtube.com/watch?v={video_id}&t=42s&list=PL123",
+            f"https://youtube.com/watch?feature=share&v={video_id}",
+            f"https://youtu.be/{video_id}?si=abc",
+            f"https://www.youtube.com/embed/{video_id}",
+            f"https://www.youtube.com/shorts/{video_id}",
+            f"https://m.youtube.com/live/{video_id}",
+            f"youtube.com/watch?v={video_id}",
+            video_id,
+        ]:
+            self.assertEqual(get_video_id(url), video_id, url)
+        with self.assertRaises(ValueError):
+            get_video_id("https://www.youtube.com/@channel")
+
+        transcriber = YouTubeTranscriber()
+        transcripts = {
+            "aaaaaaaaaaa": [{"text": "[Music]", "start": 0.0, "duration": 1.0}, {"text": "hello", "start": 1.0, "duration": 1.0}],
+            "bbbbbbbbbbb": [{"text": "world", "start": 0.0, "duration": 1.0}],
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            transcriber.cache = DiskCache(temp_dir)
+            with patch(
+                "podcastfy.content_parser.youtube_transcriber.YouTubeTranscriptApi.get_transcript",
+                side_effect=lambda video_id: transcripts[video_id],
+            ) as get_transcript:
+                urls = [
+                    "https://youtu.be/bbbbbbbbbbb",
+                    "https://www.youtube.com/watch?v=aaaaaaaaaaa&t=1",
+                    "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+                ]
+                self.assertEqual(transcriber.extract_transcripts(urls, max_workers=2), ["world", "hello", "world"])
+                self.assertEqual(get_transcript.call_count, 2)
+
+                # Fetched transcripts are served from the cache
+                self.assertEqual(transcriber.extract_transcript(urls[1]), "hello")
+                self.assertEqual(get_transcript.call_count, 2)
+
+                # ... until they expire
+                transcriber.youtube_transcriber_config = {
+                    "cache": {"enabled": True, "directory": temp_dir, "ttl_hours": 1}
+                }
+                transcriber.cache = transcriber._setup_cache()
+                path = transcriber.cache._path(DiskCache.make_key("youtube", "aaaaaaaaaaa"))
+                os.utime(path, (time.time(), time.time() - 7200))
+                self.assertEqual(transcriber.extract_transcript(urls[1]), "hello")
+                self.assertEqual(get_transcript.call_count, 3)
+
+    def test_extract_contents_youtube_batch(self):
+        """Test that batch extraction fetches each YouTube video once and keeps order and per-source errors."""
+        extractor = ContentExtractor()
+        extractor.cache = None
+        sources = [
+            "https://youtu.be/aaaaaaaaaaa",
+            "https://example.com/article",
+            "https://www.youtube.com/@channel",
+            "https://www.youtube.com/watch?v=bbbbbbbbbbb",
+            "https://www.youtube.com/watch?v=aaaaaaaaaaa&t=5",
+        ]
+
+        def get_transcript(video_id):
+            if video_id == "bbbbbbbbbbb":
+                raise RuntimeError("Transcripts are disabled")
+            return [{"text": "hello", "start": 0.0, "duration": 1.0}]
+
+        with patch(
+            "podcastfy.content_parser.youtube_transcriber.YouTubeTranscriptApi.get_transcript",
+            side_effect=get_transcript,
+        ) as fetch, patch.object(extractor.website_extractor, "extract_content", return_value="article"):
+            results = extractor.extract_contents(sources)
+            self.assertEqual(fetch.call_count, 2)
+            async_results = asyncio.run(extractor.aextract_contents(sources))
+
+        for batch in (results, async_results):
+            self.assertEqual([result.source for result in batch], sources)
+            self.assertEqual([result.content for result in batch], ["hello", "article", None, None, "hello"])
+            self.assertIsInstance(batch[2].error, ValueError)
+            self.assertIsInstance(batch[3].error, RuntimeError)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -152,6 +152,218 @@ class TestGenAIPodcast(unittest.TestCase):
             "Generated content should be relevant to the topic",
         )
 
+    def test_generate_long_form_parallel(self):
+        """
+        Test that parallel long-form generation keeps parts in order and uses the outline as context.
+        """
+        import random
+        import time
+        from langchain_core.runnables import RunnableLambda
+        from podcastfy.content_generator import LongFormContentGenerator
+
+        contexts = []
+        inputs = {}
+
+        def fake_llm(params):
+            time.sleep(random.uniform(0, 0.02))
+            contexts.append(params["context"])
+            inputs[params["input_text"]] = params["instruction"]
+            return f"<Person1>{params['input_text']}</Person1><Person2>Ok.</Person2>"
+
+        input_text = ". ".join(f"Sentence number {i} about the topic" for i in range(60))
+        generator = LongFormContentGenerator(
+            RunnableLambda(fake_llm),
+            None,
+            {"max_num_chunks": 6, "min_chunk_size": 100, "longform_parallel": True, "longform_max_workers": 3},
+        )
+        prompt_params = {"podcast_name": "Teachfy", "podcast_tagline": "Learning Through Conversation"}
+        result = generator.generate_long_form(input_text, prompt_params)
+
+        chunks = generator.chunk_content(input_text, generator.chunk_token_stats["target"])
+        self.assertEqual(sorted(inputs), sorted(chunks))
+        self.assertEqual(len(contexts), len(chunks))
+        self.assertEqual(set(contexts), {generator.build_outline(chunks)})
+        self.assertIn("last to speak must be <Person2>", inputs[chunks[-2]])
+        self.assertNotIn("last to speak must be <Person2>", inputs[chunks[-1]])
+
+        outline = generator.build_outline(["Dr. Smith asks why. Then more.", "Is it fun? Yes."])
+        self.assertEqual(outline, "Part 1: Dr. Smith asks why.\nPart 2: Is it fun?")
+        self.assertEqual(
+            result,
+            "\n".join(f"<Person1>{chunk}</Person1><Person2>Ok.</Person2>" for chunk in chunks),
+        )
+
+    def test_long_form_context_is_bounded(self):
+        """
+        Test that the long-form chat context stays within its token budget as parts are added.
+        """
+        from podcastfy.content_generator import ChatContextWindow
+        from podcastfy.utils.tokens import estimate_tokens
+
+        window = ChatContextWindow(token_budget=200)
+        for i in range(50):
+            window.add(
+                f"<Person1>Point {i} is interesting. {'More detail. ' * 10}</Person1>"
+                f"<Person2>Reply {i} agrees. {'Even more. ' * 10}</Person2>"
+            )
+            self.assertLessEqual(estimate_tokens(window.render()), 230)
+
+        context = window.render()
+        self.assertTrue(context.rstrip().endswith("</Person2>"))
+        self.assertIn("Reply 49 agrees.", context)
+        self.assertIn("- Person1: Point 47 is interesting.", context)
+        self.assertNotIn("Point 0 ", context)
+
+    def test_long_form_first_context_is_bounded(self):
+        """
+        Test that the first long-form part gets the opening of the input, capped to the context budget.
+        """
+        from langchain_core.runnables import RunnableLambda
+        from podcastfy.content_generator import LongFormContentGenerator
+        from podcastfy.utils.tokens import estimate_tokens
+
+        contexts = []
+
+        def fake_llm(params):
+            contexts.append(params["context"])
+            return "<Person1>Hi.</Person1><Person2>Ok.</Person2>"
+
+        input_text = " ".join(f"Sentence number {i} about the topic." for i in range(2000))
+        generator = LongFormContentGenerator(
+            RunnableLambda(fake_llm),
+            None,
+            {"max_num_chunks": 4, "min_chunk_size": 100, "longform_context_tokens": 300},
+        )
+        generator.generate_long_form(input_text, {"podcast_name": "Teachfy", "podcast_tagline": "Learning"})
+
+        self.assertGreater(len(contexts), 1)
+        self.assertLessEqual(estimate_tokens(contexts[0]), 300)
+        self.assertTrue(contexts[0].startswith("Sentence number 0 about the topic."))
+        self.assertTrue(contexts[0].endswith("about the topic."))
+
+    def test_prompt_cache(self):
+        """
+        Test that pinned hub prompts are pulled once and then served from the memory and disk caches.
+        """
+        from langchain_core.prompts import ChatPromptTemplate
+        from podcastfy.utils import prompt_cache
+        from podcastfy.utils.cache import DiskCache
+
+        prompt = ChatPromptTemplate.from_messages([("system", "You are a podcast host. {input_text}")])
+        with tempfile.TemporaryDirectory() as temp_dir, patch.object(
+            prompt_cache.hub, "pull", return_value=prompt
+        ) as pull:
+            disk_cache = DiskCache(temp_dir)
+            prompt_cache.clear_memory_cache()
+            first = prompt_cache.pull_prompt("owner/prompt", "abc123", disk_cache)
+            second = prompt_cache.pull_prompt("owner/prompt", "abc123", disk_cache)
+            self.assertIs(first, second)
+
+            # A new process only has the disk cache
+            prompt_cache.clear_memory_cache()
+            from_disk = prompt_cache.pull_prompt("owner/prompt", "abc123", disk_cache)
+            prompt_cache.clear_memory_cache()
+
+        pull.assert_called_once_with("owner/prompt:abc123")
+        self.assertEqual(from_disk, prompt)
+
+    def test_llm_response_cache(self):
+        """
+        Test that identical transcript requests are served from the response cache unless bypassed.
+        """
+        from langchain_core.messages import AIMessage
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_core.runnables import RunnableLambda
+        from podcastfy.utils.cache import DiskCache
+
+        calls = []
+
+        def fake_llm(prompt_value):
+            calls.append(prompt_value)
+            return AIMessage(content=f"<Person1>Hi {len(calls)}</Person1><Person2>Hello</Person2>")
+
+        prompt = ChatPromptTemplate.from_messages([("system", "Podcast {podcast_name}")])
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "test"}), patch(
+            "podcastfy.content_generator.pull_prompt", return_value=prompt
+        ), tempfile.TemporaryDirectory() as temp_dir:
+            content_generator = ContentGenerator(model_name=MODEL_NAME, api_key_label=API_KEY_LABEL)
+            content_generator.llm = RunnableLambda(fake_llm)
+            content_generator.response_cache = DiskCache(temp_dir)
+
+            first = content_generator.generate_qa_content("United States of America")
+            second = content_generator.generate_qa_content("United States of America")
+            self.assertEqual(first, second)
+            self.assertEqual(len(calls), 1)
+
+            content_generator.generate_qa_content("Canada")
+            self.assertEqual(len(calls), 2)
+
+            bypassed = content_generator.generate_qa_content("United States of America", bypass_cache=True)
+            self.assertEqual(len(calls), 3)
+            self.assertNotEqual(bypassed, first)
+
+    def test_long_form_chunks_fit_token_budget(self):
+        """
+        Test that long-form chunks are packed by tokens, including for CJK text.
+        """
+        from podcastfy.content_generator import LongFormContentGenerator
+        from podcastfy.utils.tokens import estimate_tokens
+
+        generator = LongFormContentGenerator(None, None, {"max_num_chunks": 8, "min_chunk_size": 200})
+        english = " ".join(f"Sentence {i} explains one more idea in detail." for i in range(100))
+        chinese = "".join(f"这是关于第{i}个想法的详细解释。" for i in range(200))
+
+        for text in (english, chinese):
+            chunks = generator.chunk_content(text, 100)
+            self.assertGreater(len(chunks), 1)
+            self.assertTrue(all(estimate_tokens(chunk) <= 110 for chunk in chunks))
+            self.assertTrue(all(chunk.endswith((".", "。")) for chunk in chunks))
+            self.assertEqual("".join(chunks).replace(" ", ""), text.replace(" ", ""))
+
+        # An unbroken run of text is split to fit as well
+        chunks = generator.chunk_content("这" * 500, 100)
+        self.assertEqual([estimate_tokens(chunk) for chunk in chunks], [100] * 5)
+
+    def test_sentence_segmenter(self):
+        """
+        Test sentence spans around abbreviations, initials, decimals, questions and newlines.
+        """
+        from podcastfy.utils.segmenter import iter_chunk_spans, iter_sentence_spans, split_sentences
+
+        text = (
+            "Dr. Smith met J. R. R. Tolkien in 1950, e.g. at the pub. Was it fun? Yes!\n"
+            "Version 1.5 is out.\n\nA heading\n\n这是一个测试。再见！"
+        )
+        self.assertEqual(
+            split_sentences(text),
+            [
+                "Dr. Smith met J. R. R. Tolkien in 1950, e.g. at the pub.",
+                "Was it fun?",
+                "Yes!",
+                "Version 1.5 is out.",
+                "A heading",
+                "这是一个测试。",
+                "再见！",
+            ],
+        )
+        self.assertEqual(
+            split_sentences("The answer is no. Next question. See No. 5 here. So did I. Then we left."),
+            ["The answer is no.", "Next question.", "See No. 5 here.", "So did I.", "Then we left."],
+        )
+        self.assertEqual(
+            split_sentences("U.S. growth slowed. The U.K. and the E.U. followed."),
+            ["U.S. growth slowed.", "The U.K. and the E.U. followed."],
+        )
+        # A single line break ends a sentence before a capitalized line or a list item only
+        self.assertEqual(
+            split_sentences("Key points\n- costs fell\n2. sales rose\nSummary follows\nwrapped line"),
+            ["Key points", "- costs fell", "2. sales rose", "Summary follows\nwrapped line"],
+        )
+        # Spans point into the original text
+        self.assertTrue(all(text[start:end].strip() == text[start:end] for start, end in iter_sentence_spans(text)))
+        chunk_spans = list(iter_chunk_spans(text, 10 ** 6))
+        self.assertEqual(chunk_spans, [(0, len(text))])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,7 @@ import aiohttp
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 def get_default_config() -> Dict[str, Any]:
@@ -51,16 +51,18 @@ async def generate_podcast() -> None:
 				"http://localhost:8080/generate",
 				json=get_default_config()
 			) as response:
-				if response.status != 200:
+				if response.status != 202:
 					print(f"Error: Server returned status {response.status}")
 					return
-				
-				result = await response.json()
-				if "error" in result:
-					print(f"Error: {result['error']}")
-					return
 
-				await download_podcast(session, result)
+				job = await response.json()
+
+			print(f"Queued job {job['jobId']}, waiting for it to finish...")
+			result = await wait_for_result(session, job)
+			if result is None:
+				return
+
+			await download_podcast(session, result)
 
 		except aiohttp.ClientError as e:
 			print(f"Network error: {str(e)}")
@@ -68,6 +70,30 @@ async def generate_podcast() -> None:
 			print(f"Unexpected error: {str(e)}")
 
 
+async def wait_for_result(
+	session: aiohttp.ClientSession, job: Dict[str, str], poll_interval: float = 5.0
+) -> Optional[Dict[str, str]]:
+	"""
+	Polls a generation job until it finishes.
+
+	Args:
+		session (aiohttp.ClientSession): Active client session
+		job (Dict[str, str]): API response of /generate containing resultUrl
+		poll_interval (float): Seconds to wait between polls
+
+	Returns:
+		Optional[Dict[str, str]]: Result containing audioUrl, or None if the job failed
+	"""
+	while True:
+		async with session.get(f"http://localhost:8080{job['resultUrl']}") as response:
+			if response.status == 200:
+				return await response.json()
+			if response.status != 202:
+				print(f"Error: {(await response.json()).get('detail')}")
+				return None
+		await asyncio.sleep(poll_interval)
+
+
 async def download_podcast(session: aiohttp.ClientSession, result: Dict[str, str]) -> None:
 	"""
 	Downloads the generated podcast file.